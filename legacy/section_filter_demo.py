@@ -5,14 +5,45 @@ This allows users to retrieve all content from specific sections.
 """
 
 import json
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+CATEGORIES = ("content", "tables", "images", "references")
+
+@dataclass(slots=True)
+class Item:
+    """A structured document item with attribute access instead of dict lookups."""
+    type: str
+    text: str
+    parent_section: Optional[str]
+    subsection: Optional[str]
+    section_hierarchy: Tuple[str, ...]
+    caption: Optional[str] = None
+    label: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, item: Dict) -> "Item":
+        return cls(
+            type=item.get("type") or item.get("item_type", ""),
+            text=item.get("text") or item.get("content") or "",
+            parent_section=item.get("parent_section"),
+            subsection=item.get("subsection"),
+            section_hierarchy=tuple(item.get("section_hierarchy") or ()),
+            caption=item.get("caption"),
+            label=item.get("label"),
+        )
 
 def load_structured_data(filename: str) -> Dict:
     """Load the structured data from JSON file."""
     with open(filename, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def filter_by_section(data: Dict, section_name: str) -> Dict[str, List]:
+def to_items(data: Dict) -> Dict[str, List[Item]]:
+    """Convert the item dicts of each category into slotted Item instances."""
+    return {category: [Item.from_dict(item) for item in data.get(category, [])]
+            for category in CATEGORIES}
+
+def filter_by_section(data: Dict[str, List[Item]], section_name: str) -> Dict[str, List[Item]]:
     """Filter the structured data to return only items from a specific section."""
     filtered_data = {
         "content": [],
@@ -21,42 +52,51 @@ def filter_by_section(data: Dict, section_name: str) -> Dict[str, List]:
         "references": []
     }
     
-    for category in ["content", "tables", "images", "references"]:
+    section_name_lower = section_name.lower()
+    for category in CATEGORIES:
         for item in data.get(category, []):
             # Check if the section name matches any level in the hierarchy
-            if item.get("section_hierarchy"):
-                for section in item["section_hierarchy"]:
-                    if section_name.lower() in section.lower():
+            if item.section_hierarchy:
+                for section in item.section_hierarchy:
+                    if section_name_lower in section.lower():
                         filtered_data[category].append(item)
                         break
             # Also check parent_section for direct matches
-            elif item.get("parent_section") and section_name.lower() in item["parent_section"].lower():
+            elif item.parent_section and section_name_lower in item.parent_section.lower():
                 filtered_data[category].append(item)
     
     return filtered_data
 
-def get_available_sections(data: Dict) -> List[str]:
+# Section index of the most recently queried document, which is treated as
+# immutable. Only that one document is kept, by reference, so the cache never
+# outgrows what the caller already holds and a recycled id() cannot match.
+_section_index: Optional[Tuple[Dict, List[str], Dict[Optional[str], List[str]]]] = None
+
+def _get_section_index(data: Dict[str, List[Item]]) -> Tuple[List[str], Dict[Optional[str], List[str]]]:
+    """Return (sorted main sections, sorted subsections per section) for data."""
+    global _section_index
+    if _section_index is None or _section_index[0] is not data:
+        subsections = {}
+        for category in CATEGORIES:
+            for item in data.get(category, []):
+                names = subsections.setdefault(item.parent_section, set())
+                if item.subsection:
+                    names.add(item.subsection)
+        sections = sorted(section for section in subsections if section)
+        _section_index = (data, sections, {section: sorted(names) for section, names in subsections.items()})
+    return _section_index[1], _section_index[2]
+
+def get_available_sections(data: Dict[str, List[Item]]) -> List[str]:
     """Get a list of all available main sections."""
-    sections = set()
-    for category in ["content", "tables", "images", "references"]:
-        for item in data.get(category, []):
-            if item.get("parent_section"):
-                sections.add(item["parent_section"])
-    return sorted(list(sections))
+    return list(_get_section_index(data)[0])
 
-def get_available_subsections(data: Dict, main_section: str) -> List[str]:
+def get_available_subsections(data: Dict[str, List[Item]], main_section: str) -> List[str]:
     """Get a list of all subsections within a main section."""
-    subsections = set()
-    for category in ["content", "tables", "images", "references"]:
-        for item in data.get(category, []):
-            if (item.get("parent_section") == main_section and 
-                item.get("subsection")):
-                subsections.add(item["subsection"])
-    return sorted(list(subsections))
+    return list(_get_section_index(data)[1].get(main_section, ()))
 
 def main():
     # Load the structured data
-    data = load_structured_data("burns_structured_local.json")
+    data = to_items(load_structured_data("burns_structured_local.json"))
     section_summary = load_structured_data("burns_section_summary.json")
     
     print("=== DOCUMENT STRUCTURE ===")
@@ -84,8 +124,8 @@ def main():
     if abstract_data['content']:
         print("\nAbstract content:")
         for item in abstract_data['content']:
-            if item['type'] == 'textitem':
-                print(f"• {item['text'][:200]}...")
+            if item.type == 'textitem':
+                print(f"• {item.text[:200]}...")
     
     print("\n" + "="*80)
     
@@ -100,7 +140,7 @@ def main():
     if airway_data['content']:
         print("\nFirst few items from Airway subsection:")
         for i, item in enumerate(airway_data['content'][:3], 1):
-            print(f"{i}. [{item['type']}] {item['text'][:150]}...")
+            print(f"{i}. [{item.type}] {item.text[:150]}...")
     
     print("\n" + "="*80)
     
@@ -115,8 +155,8 @@ def main():
     if woundcare_data['content']:
         print("\nWoundcare content:")
         for item in woundcare_data['content']:
-            if item['type'] == 'textitem':
-                print(f"• {item['text'][:200]}...")
+            if item.type == 'textitem':
+                print(f"• {item.text[:200]}...")
 
 if __name__ == "__main__":
     main()
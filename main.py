@@ -10,6 +10,7 @@ Usage:
     python main.py json <pdf_file>        # PDF -> JSON only
     python main.py html <json_file>       # JSON -> HTML only
     python main.py batch <input_dir>      # Batch process directory
+    python main.py serve                  # Serve JSON -> HTML rendering over HTTP
 
 Author: Chunk Monkey Team
 """
@@ -24,7 +25,7 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from processors.pdf_processor import PDFProcessor
-from generators.html_generator import HTMLGenerator
+from generators.html_generator import HTMLGenerator, serve_html
 from utils.file_utils import FileManager
 from config.settings import DEFAULT_OUTPUT_DIR
 
@@ -57,6 +58,10 @@ class ChunkMonkey:
 
         self.logger = logging.getLogger(__name__)
 
+    def close(self) -> None:
+        """Release the PDF processor's image-writing threads."""
+        self.pdf_processor.close()
+
     def process_pdf_to_json(self, pdf_path: Path) -> Path:
         """Process PDF file with image extraction and generate structured JSON."""
         self.logger.info(f"Processing PDF with image extraction: {pdf_path}")
@@ -69,14 +74,14 @@ class ChunkMonkey:
         pdf_subfolder.mkdir(exist_ok=True)
 
         # Enhanced PDF processing with images and markdown
-        doc, output_path = self.pdf_processor.process_pdf_with_images(str(pdf_path), str(pdf_subfolder))
-        structured_data = self.pdf_processor.extract_structured_data(doc)
+        doc, output_path = self.pdf_processor.process_pdf_with_images(
+            str(pdf_path), str(pdf_subfolder), save_images=False)
 
-        # Save JSON
+        # Stream structured JSON to disk, saving images in the same pass
         json_filename = f"{pdf_path.stem}_structured.json"
         json_path = pdf_subfolder / json_filename
 
-        self.file_manager.write_json_file(json_path, structured_data)
+        self.pdf_processor.stream_to_json(doc, str(json_path), write_images=True)
         self.logger.info(f"JSON saved: {json_path}")
         self.logger.info(f"Markdown and images saved to: {output_path}")
 
@@ -92,14 +97,12 @@ class ChunkMonkey:
         # Load JSON data
         structured_data = self.file_manager.read_json_file(json_path)
 
-        # Generate HTML
-        html_content = self.html_generator.generate_html_document(structured_data)
-
         # Save HTML in the same directory as the JSON file (PDF subfolder)
         html_filename = f"{json_path.stem.replace('_structured', '')}_output.html"
         html_path = json_path.parent / html_filename
 
-        self.file_manager.write_text_file(html_path, html_content)
+        # Generate HTML, streaming fragments to disk rather than joining them first
+        self.file_manager.write_text_stream(html_path, self.html_generator.iter_html_document(structured_data))
         self.logger.info(f"HTML saved: {html_path}")
 
         return html_path
@@ -124,10 +127,11 @@ class ChunkMonkey:
         html_path = self.generate_html_from_json(json_path)
 
         self.logger.info("Enhanced pipeline completed successfully!")
-        self.logger.info(f"Generated files:")
-        for key, value in results.items():
-            if key != 'output_directory':
-                self.logger.info(f"  {key}: {value}")
+        # Emit the file listing as a single record to keep one handler lock per PDF
+        summary = "\n".join(
+            f"  {key}: {value}" for key, value in results.items() if key != 'output_directory'
+        )
+        self.logger.info("Generated files:\n%s", summary)
 
         return json_path, html_path
 
@@ -167,6 +171,7 @@ Examples:
   python main.py json document.pdf             # PDF to JSON only
   python main.py html structured.json          # JSON to HTML only
   python main.py batch input_directory/        # Process all PDFs in directory
+  python main.py serve --port 8000             # POST JSON to /render, get HTML
         """
     )
 
@@ -212,6 +217,14 @@ Examples:
     )
     batch_parser.add_argument("input_dir", type=Path, help="Directory containing PDF files")
 
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve JSON -> HTML rendering over HTTP"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+
     return parser
 
 
@@ -229,7 +242,13 @@ def main():
         parser.print_help()
         return
 
+    chunk_monkey = None
     try:
+        # Serving only needs the HTML generator
+        if args.command == "serve":
+            serve_html(args.host, args.port)
+            return
+
         # Initialize ChunkMonkey
         chunk_monkey = ChunkMonkey(output_dir=args.output)
 
@@ -258,6 +277,9 @@ def main():
     except Exception as e:
         logger.error(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if chunk_monkey is not None:
+            chunk_monkey.close()
 
 
 if __name__ == "__main__":
@@ -70,6 +70,8 @@ class HTMLConfig:
     RESPONSIVE_DESIGN: bool = True
     INCLUDE_TOC: bool = True  # Table of Contents
     INCLUDE_STATS: bool = True  # Document statistics
+    EXTERNAL_CSS: bool = False  # Link a shared assets/chunkmonkey.css instead of inlining
+    INCREMENTAL_BUILD: bool = False  # Skip JSON files whose HTML is up to date (.stamp files)
     ENABLE_SEARCH: bool = True
 
     # Content display
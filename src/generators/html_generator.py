@@ -17,22 +17,28 @@ Key Features:
 Author: Chunk Monkey Team
 """
 
+import binascii
+import hashlib
+import io
 import json
 import re
-import base64
+import string
+import os
 import logging
+import functools
+import itertools
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Any, Final, Optional, TextIO, Tuple, Union
 
 try:
-    from ..config.settings import HTMLConfig
+    from ..config.settings import HTMLConfig, PerformanceConfig
     from ..utils.file_utils import FileManager
     from ..utils.text_utils import TextProcessor
 except ImportError:
     # Handle both relative and absolute imports
     try:
-        from config.settings import HTMLConfig
+        from config.settings import HTMLConfig, PerformanceConfig
         from utils.file_utils import FileManager
         from utils.text_utils import TextProcessor
     except ImportError:
@@ -42,975 +48,1354 @@ except ImportError:
         src_path = Path(__file__).parent.parent
         if str(src_path) not in sys.path:
             sys.path.insert(0, str(src_path))
-        from config.settings import HTMLConfig
+        from config.settings import HTMLConfig, PerformanceConfig
         from utils.file_utils import FileManager
         from utils.text_utils import TextProcessor
 
 logger = logging.getLogger(__name__)
 
-
-class HTMLGenerator:
+# Precompiled regular expressions
+# Inline markdown: [link](url) | **bold** | *italic* | `code`
+_RE_MD_INLINE = re.compile(
+    r'\[([^\]]+)\]\(([^)]+)\)|\*\*([^*]+)\*\*|\*([^*]+)\*|`([^`]+)`'
+)
+# Any character that can start inline markup; text without one needs no
+# markdown pass at all
+_RE_MD_META = re.compile(r'[*`\[]')
+_RE_B64_DATAURL = re.compile(r'data:image/([a-zA-Z]*);base64,([^"\s]+)')
+_RE_NUM_ROWS = re.compile(r'num_rows=(\d+)')
+_RE_NUM_COLS = re.compile(r'num_cols=(\d+)')
+_RE_HID_STRIP = re.compile(r'[^\w\s-]')
+_RE_HID_DASH = re.compile(r'[-\s]+')
+
+# ASCII heading-id translation: whitespace becomes '-', anything that is not a
+# word character or '-' is dropped (the ASCII subset of _RE_HID_STRIP/_RE_HID_DASH)
+_HEADING_ID_TABLE = {
+    code: ('-' if chr(code).isspace() else None)
+    for code in range(128)
+    if not (chr(code).isalnum() or chr(code) in '_-')
+}
+
+# Content types routed to the image and list renderers; any type containing
+# 'table' goes to the table renderer
+_IMAGE_TYPES = frozenset({'image', 'picture'})
+_LIST_TYPES = frozenset({'list', 'listitem'})
+
+# Document data keys and the source_type tag given to their items, in render order
+_SOURCE_TYPES = (
+    ('content', 'content'),
+    ('tables', 'table'),
+    ('images', 'image'),
+    ('references', 'reference'),
+)
+
+# Texts at or above this length are formatted without going through the cache
+_FORMAT_CACHE_MAX_LEN = 4096
+
+# Single-pass HTML escaping of text and attribute values
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+})
+
+
+def _esc(text: str) -> str:
+    """Escape HTML special characters in one str.translate pass."""
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+def _replace_inline_markdown(match: re.Match) -> str:
+    """Render a single inline markdown match from _RE_MD_INLINE as HTML."""
+    group = match.lastindex
+    if group == 2:
+        # Link text may itself carry bold/italic/code markup
+        link_text = _RE_MD_INLINE.sub(_replace_inline_markdown, match.group(1))
+        return f'<a href="{match.group(2)}" target="_blank" rel="noopener">{link_text}</a>'
+    if group == 3:
+        return f'<strong>{match.group(3)}</strong>'
+    if group == 4:
+        return f'<em>{match.group(4)}</em>'
+    return f'<code>{match.group(5)}</code>'
+
+
+def _has_inline_image(items: List[Dict]) -> bool:
+    """Return True if any item embeds its image as base64 rather than a file."""
+    return any('base64_data' in item and not item.get('image_filename') for item in items)
+
+
+@functools.lru_cache(maxsize=256)
+def _content_renderer_kind(content_type: str) -> str:
     """
-    HTML generator class that creates beautiful visualizations from structured JSON data.
+    Classify an item type for generate_content_item (memoized per type string).
 
-    This class handles the complete HTML generation pipeline:
-    1. Load and validate structured JSON data
-    2. Generate HTML components for different content types
-    3. Create responsive layout with navigation
-    4. Apply styling and interactive features
-    5. Output complete HTML document
+    Image types match exactly. Any type containing 'table', in any case, is
+    a table (e.g. 'TableItem', 'table_caption'). List types match exactly or
+    as 'listitem' in any case.
+
+    Returns:
+        'image', 'table', 'list' or 'text'
     """
+    lowered = content_type.lower()
+    if content_type in _IMAGE_TYPES:
+        return 'image'
+    if 'table' in lowered:
+        return 'table'
+    if content_type in _LIST_TYPES or lowered == 'listitem':
+        return 'list'
+    return 'text'
+
+
+@functools.lru_cache(maxsize=1024)
+def _title_from_stem(stem: str) -> str:
+    """Derive a document title from a JSON file stem ('my_doc' -> 'My Doc')."""
+    return stem.replace('_', ' ').title()
+
+
+def _iter_cell_texts(content: str) -> Iterator[str]:
+    """Yield the value of every text='...' field in a serialized table blob."""
+    start = 0
+    find = content.find
+    while True:
+        i = find("text='", start)
+        if i < 0:
+            return
+        j = find("'", i + 6)
+        if j < 0:
+            return
+        yield content[i + 6:j]
+        start = j + 1
+
+
+def _emit(parts: List[str], out: Optional[List[str]]) -> Optional[str]:
+    """Append rendered fragments to out when given, otherwise return them joined."""
+    if out is None:
+        return ''.join(parts)
+    out += parts
+    return None
+
+
+# Display labels for the fixed stats card keys
+_STAT_KEY_LABELS: Final[Dict[str, str]] = {
+    'total_content': 'Total Content',
+    'total_tables': 'Total Tables',
+    'total_images': 'Total Images',
+    'total_references': 'Total References',
+    'total_items': 'Total Items',
+    'processed_date': 'Processed Date',
+    'content_types': 'Content Types',
+}
+
+# Bound formatter for one "type: count" entry of a stats breakdown
+_TYPE_SPAN = "<span class='stat-detail'>{}: {}</span>".format
+
+
+def _content_types_html(content_types: Dict[str, int]) -> str:
+    """Render a content-type breakdown, dropping the 'item' suffix from type names."""
+    if len(content_types) == 1:
+        # Single-type sections (e.g. pure text) are the common case
+        (item_type, count), = content_types.items()
+        return _TYPE_SPAN(item_type.replace('item', '') if item_type.endswith('item') else item_type, count)
+    return "<br>".join(
+        _TYPE_SPAN(item_type.replace('item', '') if item_type.endswith('item') else item_type, count)
+        for item_type, count in content_types.items()
+    )
+
+
+# Base64 alphabet, used to reject payloads containing anything else
+_B64_ALPHABET = string.ascii_uppercase + string.ascii_lowercase + string.digits + '+/'
+
+# Translation table deleting every base64 character; anything left over means
+# the text is not raw base64
+_NON_B64_TABLE = str.maketrans('', '', _B64_ALPHABET + '=')
+
+# Leading magic bytes of supported image formats
+_IMAGE_MAGIC = (
+    (b'\x89PNG', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'GIF8', 'gif'),
+    (b'RIFF', 'webp'),
+)
+
+
+def _sniff_base64_image_type(text: str) -> Optional[str]:
+    """
+    Detect the image format of a base64 payload from its first 8 characters.
 
-    def __init__(self, config: Optional[Dict] = None):
-        """
-        Initialize HTML generator with configuration.
+    Args:
+        text: Base64 encoded data
 
-        Args:
-            config: Optional configuration dictionary to override defaults
-        """
-        self.config = config or {}
-        self.file_manager = FileManager()
-        self.text_processor = TextProcessor()
+    Returns:
+        Image subtype (e.g. 'png') or None if the prefix is not a known image
+    """
+    return _sniff_base64_prefix(text[:8])
 
-        # HTML generation settings
-        self.theme = self.config.get('theme', HTMLConfig.THEME)
-        self.include_toc = self.config.get('include_toc', HTMLConfig.INCLUDE_TOC)
-        self.include_stats = self.config.get('include_stats', HTMLConfig.INCLUDE_STATS)
-        self.responsive_design = self.config.get('responsive_design', HTMLConfig.RESPONSIVE_DESIGN)
 
-        logger.info(f"HTML Generator initialized with theme: {self.theme}")
+@functools.lru_cache(maxsize=256)
+def _sniff_base64_prefix(prefix: str) -> Optional[str]:
+    """Map an 8-character base64 prefix to an image subtype (memoized).
 
-    def load_json_document(self, file_path: str) -> Optional[Dict]:
-        """
-        Load and parse the structured JSON document.
+    Images of one format share the same few prefixes ('iVBORw0K' for PNG),
+    so after the first image each lookup is a single dict hit.
+    """
+    # Decode only the first two quanta; strict mode rejects anything outside
+    # the alphabet instead of silently skipping it
+    try:
+        head = binascii.a2b_base64(prefix, strict_mode=True)
+    except (binascii.Error, ValueError):
+        return None
+    if len(head) != 6:
+        return None
 
-        Args:
-            file_path: Path to the JSON file
+    for magic, image_type in _IMAGE_MAGIC:
+        if head.startswith(magic):
+            return image_type
+    return None
 
-        Returns:
-            Parsed JSON data or None if loading fails
-        """
-        try:
-            return self.file_manager.read_json_file(file_path)
-        except Exception as e:
-            logger.error(f"Error loading JSON file: {e}")
-            return None
 
-    def convert_markdown_table_to_html(self, text: str) -> str:
-        """
-        Convert markdown tables to properly formatted HTML tables.
+# Stylesheet embedded in every generated document
+_CSS_STYLES: Final[str] = """
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
 
-        Args:
-            text: Text that may contain markdown tables
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background-color: #f8f9fa;
+        }
 
-        Returns:
-            Text with markdown tables converted to HTML
-        """
-        if not text or '|' not in text:
-            return text
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background: white;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            border-radius: 8px;
+        }
 
-        lines = text.strip().split('\n')
-        table_lines = []
-        in_table = False
+        .header {
+            text-align: center;
+            margin-bottom: 2rem;
+            padding: 2rem 0;
+            border-bottom: 2px solid #e9ecef;
+        }
 
-        for line in lines:
-            line = line.strip()
-            if '|' in line and line.startswith('|') and line.endswith('|'):
-                table_lines.append(line)
-                in_table = True
-            elif in_table and line.startswith('|') and '---' in line:
-                # Skip separator line
-                continue
-            elif in_table and '|' not in line:
-                # End of table
-                break
-            elif not in_table:
-                # Not a table line, return original text
-                return text
+        .header h1 {
+            color: #2c3e50;
+            font-size: 2.5rem;
+            margin-bottom: 0.5rem;
+        }
 
-        if len(table_lines) < 2:
-            return text
+        .header .subtitle {
+            color: #6c757d;
+            font-size: 1.1rem;
+        }
 
-        # Convert to HTML table
-        html_table = ['<table class="markdown-table">']
+        .document-info {
+            background: #f8f9fa;
+            padding: 1rem;
+            border-radius: 6px;
+            margin-bottom: 2rem;
+        }
 
-        # Header row
-        header_cells = [cell.strip() for cell in table_lines[0].split('|')[1:-1]]
-        html_table.append('<thead><tr>')
-        for cell in header_cells:
-            html_table.append(f'<th>{self.text_processor.clean_text(cell)}</th>')
-        html_table.append('</tr></thead>')
+        .info-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1rem;
+        }
 
-        # Data rows
-        html_table.append('<tbody>')
-        for line in table_lines[1:]:
-            if '---' in line:
-                continue
-            cells = [cell.strip() for cell in line.split('|')[1:-1]]
-            html_table.append('<tr>')
-            for cell in cells:
-                html_table.append(f'<td>{self.text_processor.clean_text(cell)}</td>')
-            html_table.append('</tr>')
-        html_table.append('</tbody>')
-        html_table.append('</table>')
+        .info-item {
+            background: white;
+            padding: 1rem;
+            border-radius: 4px;
+            border-left: 4px solid #007bff;
+        }
 
-        return '\n'.join(html_table)
+        .stats-card {
+            background: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 6px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+        }
 
-    def detect_and_convert_base64_image(self, text: str) -> Tuple[str, bool]:
-        """
-        Detect base64 encoded images and convert to proper data URLs.
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 1rem;
+        }
 
-        Args:
-            text: Text that may contain base64 image data
+        .stat-item {
+            background: white;
+            padding: 1rem;
+            border-radius: 4px;
+            border-left: 4px solid #28a745;
+        }
 
-        Returns:
-            Tuple of (converted_text, is_image_found)
-        """
-        if not text:
-            return text, False
+        .stat-detail {
+            font-size: 0.9rem;
+            color: #6c757d;
+            display: block;
+            margin-top: 0.5rem;
+        }
 
-        # Pattern for existing data URLs
-        base64_pattern = r'data:image/([a-zA-Z]*);base64,([^"\s]+)'
+        .content {
+            padding: 30px;
+        }
 
-        if re.search(base64_pattern, text):
-            return text, True
+        .section {
+            margin: 20px 0;
+            border: 1px solid #e9ecef;
+            border-radius: 10px;
+            overflow: hidden;
+        }
 
-        # Check if text looks like raw base64 (common patterns)
-        if len(text) > 100 and re.match(r'^[A-Za-z0-9+/=]+$', text.strip()):
-            # Try to detect image type from first few bytes
-            try:
-                decoded = base64.b64decode(text[:20])
-                if decoded.startswith(b'\x89PNG'):
-                    return f"data:image/png;base64,{text.strip()}", True
-                elif decoded.startswith(b'\xff\xd8\xff'):
-                    return f"data:image/jpeg;base64,{text.strip()}", True
-                elif decoded.startswith(b'GIF8'):
-                    return f"data:image/gif;base64,{text.strip()}", True
-                elif decoded.startswith(b'RIFF'):
-                    return f"data:image/webp;base64,{text.strip()}", True
-            except Exception as e:
-                logger.debug(f"Error decoding base64 image: {e}")
+        .section-header {
+            background: #f8f9fa;
+            padding: 20px;
+            border-bottom: 1px solid #e9ecef;
+        }
 
-        return text, False
+        .section-title {
+            color: #2c3e50;
+            margin-bottom: 5px;
+        }
 
-    def format_text_content(self, text: str) -> str:
-        """
-        Format text content with markdown-style formatting and HTML conversion.
+        .section-meta {
+            color: #666;
+            font-size: 0.9rem;
+            font-weight: normal;
+        }
 
-        Args:
-            text: Raw text content to format
+        .section-stats {
+            padding: 15px 20px;
+            background: #f1f3f4;
+        }
 
-        Returns:
-            Formatted HTML text
-        """
-        if not text:
-            return text
+        .section-stats details summary {
+            cursor: pointer;
+            font-weight: 500;
+            color: #555;
+        }
 
-        # Clean the text first
-        formatted_text = self.text_processor.clean_text(text)
+        .mini-stats .stats-card {
+            margin: 10px 0;
+            padding: 15px;
+        }
 
-        # Convert markdown tables to HTML
-        formatted_text = self.convert_markdown_table_to_html(formatted_text)
+        .section-content {
+            padding: 20px;
+        }
 
-        # Convert markdown links to HTML
-        formatted_text = re.sub(
-            r'\[([^\]]+)\]\(([^)]+)\)',
-            r'<a href="\2" target="_blank" rel="noopener">\1</a>',
-            formatted_text
-        )
+        .content-item {
+            margin: 15px 0;
+            padding: 15px;
+            border-radius: 8px;
+            border-left: 4px solid #3498db;
+        }
 
-        # Convert **bold** to HTML
-        formatted_text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', formatted_text)
+        .text-item {
+            background: #f8f9fa;
+            border-left-color: #3498db;
+        }
 
-        # Convert *italic* to HTML
-        formatted_text = re.sub(r'\*([^*]+)\*', r'<em>\1</em>', formatted_text)
+        .image-item {
+            background: #e8f5e8;
+            border-left-color: #27ae60;
+        }
 
-        # Convert inline code
-        formatted_text = re.sub(r'`([^`]+)`', r'<code>\1</code>', formatted_text)
+        .list-item {
+            background: #fff3cd;
+            border-left-color: #ffc107;
+        }
 
-        # Convert line breaks to HTML (but not within tables)
-        if '<table' not in formatted_text:
-            formatted_text = formatted_text.replace('\n', '<br>')
+        .heading-item {
+            background: #e7f3ff;
+            border-left-color: #007bff;
+        }
 
-        return formatted_text
+        .table-item {
+            background: #f0f8ff;
+            border-left-color: #8a2be2;
+        }
 
-    def generate_stats_card(self, data: Dict) -> str:
-        """
-        Generate HTML for document statistics.
+        .table-row-item {
+            background: #f5f5f5;
+            border-left-color: #999;
+        }
 
-        Args:
-            data: Structured document data
+        .content-meta {
+            font-size: 0.8rem;
+            color: #666;
+            margin-bottom: 10px;
+            font-weight: 500;
+        }
 
-        Returns:
-            HTML string for statistics card
-        """
-        if not self.include_stats:
-            return ""
+        .text-content {
+            line-height: 1.7;
+        }
 
-        # Calculate statistics
-        stats = {
-            'total_content': len(data.get('content', [])),
-            'total_tables': len(data.get('tables', [])),
-            'total_images': len(data.get('images', [])),
-            'total_references': len(data.get('references', [])),
+        .text-content code {
+            background: #f8f9fa;
+            padding: 0.2rem 0.4rem;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+            font-size: 0.9em;
         }
 
-        # Add metadata stats if available
-        metadata = data.get('metadata', {})
-        if metadata:
-            stats['total_items'] = metadata.get('total_items', 0)
-            if metadata.get('processing_timestamp'):
-                try:
-                    timestamp = datetime.fromisoformat(metadata['processing_timestamp'].replace('Z', '+00:00'))
-                    stats['processed_date'] = timestamp.strftime('%Y-%m-%d %H:%M')
-                except:
-                    stats['processed_date'] = metadata['processing_timestamp']
-
-        # Count content types
-        content_types = {}
-        for item in data.get('content', []):
-            item_type = item.get('type', 'text')
-            content_types[item_type] = content_types.get(item_type, 0) + 1
+        .text-content a {
+            color: #007bff;
+            text-decoration: none;
+        }
 
-        if content_types:
-            stats['content_types'] = content_types
+        .text-content a:hover {
+            text-decoration: underline;
+        }
 
-        # Generate HTML
-        stat_items = []
-        for key, value in stats.items():
-            formatted_key = key.replace('_', ' ').title()
-            if isinstance(value, dict):
-                # Handle nested stats like content_types
-                nested_items = []
-                for sub_key, sub_value in value.items():
-                    nested_items.append(f"<span class='stat-detail'>{sub_key}: {sub_value}</span>")
-                stat_items.append(
-                    f"<div class='stat-item'><strong>{formatted_key}:</strong><br>{'<br>'.join(nested_items)}</div>"
-                )
-            else:
-                stat_items.append(f"<div class='stat-item'><strong>{formatted_key}:</strong> {value}</div>")
+        .markdown-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 1rem 0;
+            font-size: 0.9rem;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
 
-        return f"""
-        <div class="stats-card">
-            <h3>📊 Document Statistics</h3>
-            <div class="stats-grid">
-                {''.join(stat_items)}
-            </div>
-        </div>
-        """
+        .markdown-table th {
+            background: #f8f9fa;
+            font-weight: 600;
+            padding: 12px;
+            text-align: left;
+            border-bottom: 2px solid #dee2e6;
+        }
 
-    def generate_content_item(self, item: Dict, item_index: int = 0) -> str:
-        """
-        Generate HTML for a single content item.
+        .markdown-table td {
+            padding: 12px;
+            border-bottom: 1px solid #dee2e6;
+        }
 
-        Args:
-            item: Content item dictionary
-            item_index: Index of the item for unique IDs
+        .markdown-table tbody tr:nth-of-type(even) {
+            background: #f8f9fa;
+        }
 
-        Returns:
-            HTML string for the content item
-        """
-        content_type = item.get('type', 'text')
+        .markdown-table tbody tr:hover {
+            background: #e3f2fd;
+            cursor: pointer;
+        }
 
-        # Handle different content types
-        if content_type in ['image', 'picture'] or 'base64_data' in item:
-            return self._generate_image_item(item, item_index)
-        elif content_type == 'table' or 'table' in content_type.lower() or content_type.lower() == 'tableitem':
-            return self._generate_table_item(item, item_index)
-        elif content_type in ['list', 'listitem'] or content_type.lower() == 'listitem':
-            return self._generate_list_item(item, item_index)
-        else:
-            return self._generate_text_item(item, item_index)
+        .markdown-table tbody tr:last-of-type td {
+            border-bottom: none;
+        }
 
-    def _generate_image_item(self, item: Dict, item_index: int) -> str:
-        """Generate HTML for image items."""
-        # Check if this item has external image reference
-        image_filename = item.get('image_filename', '')
-        image_path = item.get('image_path', '')
-        line_number = item_index * 2 + 3
+        .list-content {
+            line-height: 1.7;
+        }
 
-        if image_filename:
-            # Use external image reference
-            caption = item.get('caption', '')
-            label = item.get('label', f'image_{item_index}')
-
-            img_html = f"""
-        <div class="content-item image-item" id="{label}">
-            <div class="content-meta">🖼️ Image (Line {line_number})</div>
-            <div class="image-container">
-                <img src="{image_filename}" alt="{caption or 'Document image'}" loading="lazy">
-            </div>
-            {f'<div class="image-caption">{self.format_text_content(caption)}</div>' if caption else ''}
-        </div>
-        """
-        else:
-            # Fallback to base64 data
-            img_data = item.get('base64_data', item.get('content', ''))
-            caption = item.get('caption', '')
-            label = item.get('label', f'image_{item_index}')
+        .content-heading {
+            color: #2c3e50;
+        }
 
-            # Convert to data URL if needed
-            data_url, is_image = self.detect_and_convert_base64_image(img_data)
+        .image-container {
+            text-align: center;
+        }
 
-            if not is_image:
-                # Fallback for non-image content
-                return self._generate_text_item(item, item_index)
+        .image-container img {
+            max-width: 100%;
+            height: auto;
+            border-radius: 6px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+            transition: transform 0.3s ease;
+        }
 
-            # Generate image HTML
-            img_html = f"""
-        <div class="content-item image-item" id="{label}">
-            <div class="content-meta">
-                <span class="item-type">🖼️ Image</span>
-                <span class="item-label">{label}</span>
-            </div>
-            <div class="image-container">
-                <img src="{data_url}" alt="{caption or 'Document image'}" loading="lazy">
-            </div>
-            {f'<div class="image-caption">{self.format_text_content(caption)}</div>' if caption else ''}
-        </div>
+        .image-container img:hover {
+            transform: scale(1.02);
+        }
+
+        .image-error {
+            background: #f8d7da;
+            color: #721c24;
+            padding: 1rem;
+            border-radius: 4px;
+            text-align: center;
+            border: 1px solid #f5c6cb;
+        }
+
+        .image-caption {
+            margin-top: 0.5rem;
+            font-style: italic;
+            color: #6c757d;
+            text-align: center;
+        }
+
+        .table-of-contents {
+            background: #f8f9fa;
+            padding: 1.5rem;
+            border-radius: 6px;
+            margin-bottom: 2rem;
+        }
+
+        .table-of-contents ul {
+            list-style: none;
+            padding-left: 0;
+        }
+
+        .table-of-contents li {
+            margin: 0.5rem 0;
+        }
+
+        .table-of-contents a {
+            color: #007bff;
+            text-decoration: none;
+            padding: 0.5rem;
+            display: block;
+            border-radius: 4px;
+            transition: background-color 0.3s ease;
+        }
+
+        .table-of-contents a:hover {
+            background: #dee2e6;
+        }
+
+        .depth-0 {}
+        .depth-1 {}
+        .depth-2 {}
+        .depth-3 {}
+        .depth-4 {}
+        .depth-5 {}
+
+        .footer {
+            text-align: center;
+            margin-top: 3rem;
+            padding: 2rem 0;
+            border-top: 1px solid #e9ecef;
+            color: #6c757d;
+        }
+
+        @media (max-width: 768px) {
+            body {
+                padding: 10px;
+            }
+
+            .header h1 {
+                font-size: 2rem;
+            }
+
+            .content {
+                padding: 0;
+            }
+
+            .depth-1, .depth-2, .depth-3, .depth-4, .depth-5 {
+                margin-left: 0.5rem;
+            }
+        }
         """
 
-        return img_html
 
-    def _generate_table_item(self, item: Dict, item_index: int) -> str:
-        """Generate HTML for table items."""
-        content = item.get('content', '')
-        caption = item.get('caption', '')
-        label = item.get('label', f'table_{item_index}')
-        line_number = item_index * 2 + 3
+# Document skeleton with the stylesheet baked in, split around the sections so
+# the page can be streamed. The doctype, meta tags and stylesheet are plain
+# constants emitted as-is; only the short header after them is a Template, so
+# substitution never scans the CSS.
+_DOC_HEAD_OPEN: Final[str] = """
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>"""
+_DOC_BODY_OPEN: Final[str] = """
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>📄 """
+_DOC_STYLE_BLOCK: Final[str] = f"""</title>
+            <style>
+                {_CSS_STYLES}
+            </style>{_DOC_BODY_OPEN}"""
+# Head tail used when the stylesheet is written as a shared external asset
+_DOC_LINK_BLOCK = """</title>
+            <link rel="stylesheet" href="{}">{}""".format
+# Changing the generator code invalidates every incremental build stamp
+_MODULE_MTIME_NS: Final[int] = os.stat(__file__).st_mtime_ns
+
+# Location of the shared stylesheet, relative to the generated HTML files
+_CSS_ASSET_PATH: Final[str] = 'assets/chunkmonkey.css'
+_DOC_HEADER_TEMPLATE: Final[string.Template] = string.Template("""$title</h1>
+                    <div class="subtitle">Generated on $timestamp</div>
+                </div>
 
-        # Check if there's an external table image based on label
-        table_image_filename = None
-        if label and 'table_' in label:
-            # Extract table number from label (e.g., 'table_1' -> '1')
-            table_num = label.split('_')[-1]
-            table_image_filename = f"burns-table-{table_num}.png"
-        elif item_index < 4:  # We know there are 4 tables from processing
-            table_image_filename = f"burns-table-{item_index + 1}.png"
+                <div class="document-info">
+                    <div class="info-grid">
+                        <div class="info-item">
+                            <strong>Total Items:</strong> $total_items
+                        </div>
+                        <div class="info-item">
+                            <strong>Sections:</strong> $section_count
+                        </div>
+                    </div>
+                </div>
 
-        # Try to parse table structure from content
-        table_html_content = self._parse_table_content(content)
+                $stats_card
 
-        # Generate table HTML with image reference if available
-        table_html = f"""
-        <div class="content-item table-item" id="{label}">
-            <div class="content-meta">📊 Table (Line {line_number})</div>
-            {f'<div class="table-caption">{self.format_text_content(caption)}</div>' if caption else ''}
-            <div class="table-content">
-                {table_html_content}
+                <div class="content">
+                    """)
+_DOC_FOOTER: Final[str] = """
+                </div>
+
+                <div class="footer">
+                    <p>Generated by Chunk Monkey HTML Generator</p>
+                </div>
             </div>
-            {f'<div class="table-image"><img src="{table_image_filename}" alt="Table {item_index + 1}" loading="lazy"></div>' if table_image_filename else ''}
-        </div>
+        </body>
+        </html>
         """
 
-        return table_html
+# Static head and footer parts, as str and pre-encoded for the file writer
+_DOC_SKELETON: Final[Tuple[str, str, str]] = (_DOC_HEAD_OPEN, _DOC_STYLE_BLOCK, _DOC_FOOTER)
+_DOC_SKELETON_BYTES: Final[Tuple[bytes, ...]] = tuple(part.encode('utf-8') for part in _DOC_SKELETON)
 
-    def _parse_table_content(self, content: str) -> str:
-        """Parse table content and generate proper HTML table."""
-        if not content:
-            return "<p>No table content available</p>"
+# CSS classes for the common section depths
+_DEPTH_CLASSES: Final[Tuple[str, ...]] = tuple(f'depth-{i}' for i in range(6))
 
-        # Check if content contains table cell information
-        if 'table_cells=' in content and 'num_rows=' in content and 'num_cols=' in content:
-            # Extract basic table info
-            import re
-            rows_match = re.search(r'num_rows=(\d+)', content)
-            cols_match = re.search(r'num_cols=(\d+)', content)
 
-            if rows_match and cols_match:
-                num_rows = int(rows_match.group(1))
-                num_cols = int(cols_match.group(1))
+def _depth_class(depth: int) -> str:
+    """Return the depth-N CSS class, reusing the interned string for common depths."""
+    return _DEPTH_CLASSES[depth] if 0 <= depth < len(_DEPTH_CLASSES) else f'depth-{depth}'
 
-                if num_rows > 0 and num_cols > 0:
-                    # Try to extract cell text from the content
-                    cell_texts = re.findall(r"text='([^']*)'", content)
 
-                    if cell_texts:
-                        return self._generate_html_table(cell_texts, num_rows, num_cols)
+# Section skeletons shared by generate_section and the document renderer;
+# filled in with str.format so the literal markup is not rebuilt per section
+_SECTION_STATS_FMT: Final[str] = """
+    <div class="stats-card">
+        <h3>📊 Document Statistics</h3>
+        <div class="stats-grid">
+            <div class='stat-item'><strong>Total Items:</strong> {total}</div><div class='stat-item'><strong>Content Types:</strong><br>{types}</div><div class='stat-item'><strong>Image Count:</strong> {images}</div><div class='stat-item'><strong>Text Blocks:</strong> {text}</div><div class='stat-item'><strong>List Items:</strong> {lists}</div><div class='stat-item'><strong>Table Rows:</strong> {tables}</div><div class='stat-item'><strong>Subsection Count:</strong> 0</div>
+        </div>
+    </div>
+    """
+_SECTION_HEAD_FMT: Final[str] = """
+    <div class="section {depth_class}">
+        <div class="section-header">
+            <h2 class="section-title">{name}</h2>
+            <span class="section-meta">{line_meta}</span>
+        </div>
 
-        # Fallback: check if content looks like markdown table
-        if '|' in content and '\n' in content:
-            return self.convert_markdown_table_to_html(content)
+        <div class="section-stats">
+            <details>
+                <summary>📈 Section Statistics</summary>
+                <div class="mini-stats">
+                    {stats}
+                </div>
+            </details>
+        </div>
 
-        # Final fallback: format as preformatted text
-        return f"<pre class='table-raw'>{self.format_text_content(content)}</pre>"
 
-    def _generate_html_table(self, cell_texts: list, num_rows: int, num_cols: int) -> str:
-        """Generate HTML table from cell data."""
-        if not cell_texts or num_rows == 0 or num_cols == 0:
-            return "<p>Empty table</p>"
+        <div class="section-content">
+            """
+_SECTION_LINE_META: Final[str] = 'Line {} • Level 2'
+_SECTION_FOOTER: Final[str] = """
+        </div>
 
-        # Calculate expected cells
-        expected_cells = num_rows * num_cols
 
-        # Pad or truncate cell_texts to match expected size
-        while len(cell_texts) < expected_cells:
-            cell_texts.append("")
-        cell_texts = cell_texts[:expected_cells]
+    </div>
+    """
 
-        # Generate table HTML
-        table_html = ['<table class="markdown-table">']
 
-        for row in range(num_rows):
-            table_html.append('  <tr>')
-            for col in range(num_cols):
-                cell_index = row * num_cols + col
-                cell_text = cell_texts[cell_index] if cell_index < len(cell_texts) else ""
+class HTMLGenerator:
+    """
+    HTML generator class that creates beautiful visualizations from structured JSON data.
+
+    This class handles the complete HTML generation pipeline:
+    1. Load and validate structured JSON data
+    2. Generate HTML components for different content types
+    3. Create responsive layout with navigation
+    4. Apply styling and interactive features
+    5. Output complete HTML document
+    """
+
+    __slots__ = (
+        'config',
+        'file_manager',
+        'text_processor',
+        '_clean_cached',
+        '_format_cached',
+        '_parse_table_cached',
+        '_load_json_cached',
+        'theme',
+        'include_toc',
+        'include_stats',
+        'responsive_design',
+        'external_css',
+        'incremental',
+    )
+
+    # Output directories whose shared stylesheet has already been written
+    _assets_written: set = set()
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Initialize HTML generator with configuration.
+
+        Args:
+            config: Optional configuration dictionary to override defaults
+        """
+        self.config = config or {}
+        self.file_manager = FileManager()
+        self.text_processor = TextProcessor()
 
-                # First row is typically headers
-                tag = 'th' if row == 0 else 'td'
-                table_html.append(f'    <{tag}>{self.format_text_content(cell_text)}</{tag}>')
-            table_html.append('  </tr>')
+        # Table cells and headings repeat heavily within and across documents,
+        # so cache cleaned text per unique input string
+        self._clean_cached = functools.lru_cache(maxsize=8192)(self.text_processor.clean_text)
+        # Formatted fragments and parsed tables are keyed on the content string,
+        # so re-rendering a document reuses the previous results
+        self._format_cached = functools.lru_cache(maxsize=2048)(self._format_text)
+        self._parse_table_cached = functools.lru_cache(maxsize=256)(self._parse_table_content)
+        # Parsed JSON documents keyed by (path, mtime_ns, size); a rewritten
+        # file gets a new key, so re-rendering only re-parses changed inputs
+        self._load_json_cached = functools.lru_cache(maxsize=32)(self._read_json_document)
 
-        table_html.append('</table>')
-        return '\n'.join(table_html)
+        # HTML generation settings
+        self.theme = self.config.get('theme', HTMLConfig.THEME)
+        self.include_toc = self.config.get('include_toc', HTMLConfig.INCLUDE_TOC)
+        self.include_stats = self.config.get('include_stats', HTMLConfig.INCLUDE_STATS)
+        self.responsive_design = self.config.get('responsive_design', HTMLConfig.RESPONSIVE_DESIGN)
+        self.external_css = self.config.get('external_css', HTMLConfig.EXTERNAL_CSS)
+        self.incremental = self.config.get('incremental', HTMLConfig.INCREMENTAL_BUILD)
 
-    def _generate_list_item(self, item: Dict, item_index: int) -> str:
-        """Generate HTML for list items."""
-        content = item.get('text', item.get('content', ''))
-        line_number = item_index * 2 + 3
+        logger.info("HTML Generator initialized with theme: %s", self.theme)
 
-        list_html = f"""
-        <div class="content-item list-item">
-            <div class="content-meta">📋 List (Line {line_number})</div>
-            <div class="list-content">
-                {self.format_text_content(content)}
-            </div>
-        </div>
+    def load_json_document(self, file_path: str) -> Optional[Dict]:
         """
+        Load and parse the structured JSON document.
 
-        return list_html
+        Args:
+            file_path: Path to the JSON file
 
-    def _generate_text_item(self, item: Dict, item_index: int) -> str:
-        """Generate HTML for text items."""
-        content = item.get('text', item.get('content', ''))
-        content_type = item.get('type', 'text')
+        Returns:
+            Parsed JSON data or None if loading fails. Repeat loads of an
+            unchanged file return the same cached object, which the generator
+            only reads; callers must not modify it.
+        """
+        try:
+            path = os.path.abspath(file_path)
+            stat = os.stat(path)
+            return self._load_json_cached(path, stat.st_mtime_ns, stat.st_size)
+        except Exception as e:
+            logger.error("Error loading JSON file: %s", e)
+            return None
 
-        # Determine if this is a heading based on the type field
-        is_heading = 'header' in content_type.lower() or 'heading' in content_type.lower() or content_type.lower() == 'sectionheaderitem'
+    def _read_json_document(self, path: str, mtime_ns: int, size: int) -> Dict:
+        """Read a JSON file; mtime_ns and size only serve as cache key parts."""
+        return self.file_manager.read_json_file(path)
 
-        # Calculate line number based on item index
-        line_number = item_index * 2 + 3
+    def convert_markdown_table_to_html(self, text: str) -> str:
+        """
+        Convert markdown tables to properly formatted HTML tables.
 
-        if is_heading:
-            # Generate heading item
-            heading_level = self._determine_heading_level(content, item)
-            heading_id = self._generate_heading_id(content)
+        Args:
+            text: Text that may contain markdown tables
 
-            text_html = f"""
-            <div class="content-item heading-item depth-{heading_level}" id="{heading_id}">
-                <div class="content-meta">
-                    <span class="item-type">📑 Heading {heading_level}</span>
-                </div>
-                <h{heading_level} class="content-heading">{self.format_text_content(content)}</h{heading_level}>
-            </div>
-            """
-        else:
-            # Generate regular text item
-            text_html = f"""
-        <div class="content-item text-item">
-            <div class="content-meta">📄 Text (Line {line_number})</div>
-            <div class="text-content">{self.format_text_content(content)}</div>
-        </div>
+        Returns:
+            Text with markdown tables converted to HTML
         """
+        # A table needs pipes and at least two lines
+        if not text or '|' not in text or '\n' not in text:
+            return text
 
-        return text_html
+        table_lines = []
+        in_table = False
 
-    def _determine_heading_level(self, content: str, item: Dict) -> int:
-        """Determine heading level based on content and hierarchy."""
-        # Check section hierarchy if available
-        hierarchy = item.get('section_hierarchy', [])
-        if hierarchy:
-            level = len(hierarchy)
-            return min(max(level, 1), 6)  # HTML only supports h1-h6, minimum h1
+        for line in text.splitlines():
+            line = line.strip()
+            if not line and not in_table:
+                # Skip leading blank lines
+                continue
+            if '|' in line and line.startswith('|') and line.endswith('|'):
+                table_lines.append(line)
+                in_table = True
+            elif in_table and line.startswith('|') and '---' in line:
+                # Skip separator line
+                continue
+            elif in_table and '|' not in line:
+                # End of table
+                break
+            elif not in_table:
+                # Not a table line, return original text
+                return text
 
-        # Fallback to content analysis for better semantic structure
-        if content.isupper() and len(content) > 20:
-            return 1  # Main sections
-        elif content.endswith(':'):
-            return 2  # Subsections
-        elif len(content) > 50:
-            return 2  # Longer descriptive headers
-        else:
-            return 3  # Minor headings
+        if len(table_lines) < 2:
+            return text
 
-    def _generate_heading_id(self, content: str) -> str:
-        """Generate a valid HTML ID from heading content."""
-        # Clean and normalize the content
-        clean_content = re.sub(r'[^\w\s-]', '', content.lower())
-        clean_content = re.sub(r'[-\s]+', '-', clean_content).strip('-')
-        return clean_content or 'heading'
+        # Convert to HTML table, appending literal tags and cleaned cell text to
+        # one fragment list
+        clean = self._clean_cached
+        parts = ['<table class="markdown-table">\n<thead><tr>\n']
+        append = parts.append
+
+        # Header row. Table lines start and end with '|', so the cells are the
+        # inner slice split on '|' (a lone '|' has no cells)
+        header = table_lines[0]
+        for cell in (header[1:-1].split('|') if len(header) > 1 else ()):
+            cell = cell.strip()
+            append('<th>')
+            if cell:
+                append(_esc(clean(cell)))
+            append('</th>\n')
+        append('</tr></thead>\n<tbody>\n')
 
-    def generate_section(self, section_name: str, items: List[Dict], section_type: str = "content", depth: int = 0) -> str:
+        # Data rows
+        for line in table_lines[1:]:
+            if '---' in line:
+                continue
+            append('<tr>\n')
+            for cell in (line[1:-1].split('|') if len(line) > 1 else ()):
+                cell = cell.strip()
+                append('<td>')
+                if cell:
+                    append(_esc(clean(cell)))
+                append('</td>\n')
+            append('</tr>\n')
+        append('</tbody>\n</table>')
+
+        return ''.join(parts)
+
+    def detect_and_convert_base64_image(self, text: str) -> Tuple[str, bool]:
         """
-        Generate HTML for a complete section with all its items.
+        Detect base64 encoded images and convert to proper data URLs.
 
         Args:
-            section_name: Name of the section
-            items: List of items in the section
-            section_type: Type of section (content, tables, images, references)
-            depth: Hierarchy depth for CSS classes
+            text: Text that may contain base64 image data
 
         Returns:
-            HTML string for the complete section
+            Tuple of (converted_text, is_image_found)
         """
-        if not items:
-            return ""
-
-        # Generate section statistics
-        item_count = len(items)
-        text_count = len([i for i in items if i.get('type') == 'textitem'])
-        list_count = len([i for i in items if i.get('type') == 'listitem'])
-        table_count = len([i for i in items if i.get('type') == 'tableitem'])
-        image_count = len([i for i in items if i.get('type') == 'imageitem'])
-
-        # Count content types for stats
-        content_types = {}
-        for item in items:
-            item_type = item.get('type', 'unknown')
-            content_types[item_type] = content_types.get(item_type, 0) + 1
+        prefix, payload = self._split_base64_image(text)
+        if payload is None:
+            return text, False
+        return prefix + payload, True
 
-        # Generate items HTML
-        items_html = []
-        for i, item in enumerate(items):
-            if section_type == 'images':
-                items_html.append(self._generate_image_item(item, i))
-            elif section_type == 'tables':
-                items_html.append(self._generate_table_item(item, i))
-            else:
-                items_html.append(self.generate_content_item(item, i))
+    def _split_base64_image(self, text: str) -> Tuple[str, Optional[str]]:
+        """
+        Detect a base64 image without building the data URL string.
 
-        # Generate content types breakdown
-        content_types_html = ""
-        if content_types:
-            type_details = []
-            for item_type, count in content_types.items():
-                display_type = item_type.replace('item', '') if item_type.endswith('item') else item_type
-                type_details.append(f"<span class='stat-detail'>{display_type}: {count}</span>")
-            content_types_html = "<br>".join(type_details)
+        Args:
+            text: Text that may contain base64 image data
 
-        # Generate mini stats for this section
-        mini_stats_html = f"""
-    <div class="stats-card">
-        <h3>📊 Document Statistics</h3>
-        <div class="stats-grid">
-            <div class='stat-item'><strong>Total Items:</strong> {item_count}</div><div class='stat-item'><strong>Content Types:</strong><br>{content_types_html}</div><div class='stat-item'><strong>Image Count:</strong> {image_count}</div><div class='stat-item'><strong>Text Blocks:</strong> {text_count}</div><div class='stat-item'><strong>List Items:</strong> {list_count}</div><div class='stat-item'><strong>Table Rows:</strong> {table_count}</div><div class='stat-item'><strong>Subsection Count:</strong> 0</div>
-        </div>
-    </div>
-    """ if self.include_stats else ""
+        Returns:
+            Tuple of (data_url_prefix, payload). The data URL is prefix followed
+            by payload, and payload is None when no image was found. For raw
+            base64 the payload is the stripped text; for text containing a data
+            URL, prefix is empty and the payload is only the matched URL.
+        """
+        if not text:
+            return '', None
+
+        # Check for existing data URLs; the plain substring probe keeps the
+        # regex off payloads that cannot contain one
+        if 'data:image/' in text:
+            match = _RE_B64_DATAURL.search(text)
+            if match:
+                return '', match.group(0)
+
+        # Check if text looks like raw base64 (common patterns). The magic bytes
+        # of the decoded prefix are checked first, so ordinary long text is
+        # rejected after 8 characters instead of a full alphabet scan.
+        if len(text) > 100:
+            image_type = _sniff_base64_image_type(text)
+            if image_type:
+                stripped = text.strip()
+                if not stripped.translate(_NON_B64_TABLE):
+                    return f"data:image/{image_type};base64,", stripped
+
+        return '', None
 
-        section_html = f"""
-    <div class="section depth-{depth}">
-        <div class="section-header">
-            <h2 class="section-title">{section_name}</h2>
-            <span class="section-meta">Line {i+1} • Level 2</span>
-        </div>
+    def format_text_content(self, text: str) -> str:
+        """
+        Format text content with markdown-style formatting and HTML conversion.
 
-        <div class="section-stats">
-            <details>
-                <summary>📈 Section Statistics</summary>
-                <div class="mini-stats">
-                    {mini_stats_html}
-                </div>
-            </details>
-        </div>
+        Args:
+            text: Raw text content to format
 
+        Returns:
+            Formatted HTML text
+        """
+        if text and len(text) < _FORMAT_CACHE_MAX_LEN:
+            return self._format_cached(text)
+        return self._format_text(text)
 
-        <div class="section-content">
-            {''.join(items_html)}
-        </div>
+    def _format_text(self, text: str) -> str:
+        """Uncached implementation of format_text_content."""
+        if not text:
+            return text
 
+        # Clean the text first, then escape it so only generated markup is HTML.
+        # clean_text collapses all whitespace, newlines included, so the result
+        # is a single line: markdown tables and line breaks cannot survive it
+        # and are rendered by _generate_table_item instead.
+        formatted_text = _esc(self._clean_cached(text))
 
-    </div>
-    """
+        # Plain prose has nothing for the inline pass to match
+        if not _RE_MD_META.search(formatted_text):
+            return formatted_text
 
-        return section_html
+        # Convert links, **bold**, *italic* and inline code in a single pass
+        return _RE_MD_INLINE.sub(_replace_inline_markdown, formatted_text)
 
-    def generate_table_of_contents(self, data: Dict) -> str:
+    def generate_stats_card(self, data: Dict) -> str:
         """
-        Generate table of contents from document structure.
+        Generate HTML for document statistics.
 
         Args:
             data: Structured document data
 
         Returns:
-            HTML string for table of contents
+            HTML string for statistics card
         """
-        if not self.include_toc:
+        if not self.include_stats:
             return ""
 
-        toc_items = []
-
-        # Add sections based on available data
-        if data.get('content'):
-            toc_items.append('<li><a href="#content-section">📄 Content</a></li>')
-
-        if data.get('tables'):
-            toc_items.append('<li><a href="#tables-section">📊 Tables</a></li>')
+        # Calculate statistics
+        stats = {
+            'total_content': len(data.get('content', [])),
+            'total_tables': len(data.get('tables', [])),
+            'total_images': len(data.get('images', [])),
+            'total_references': len(data.get('references', [])),
+        }
 
-        if data.get('images'):
-            toc_items.append('<li><a href="#images-section">🖼️ Images</a></li>')
+        # Add metadata stats if available
+        metadata = data.get('metadata', {})
+        if metadata:
+            stats['total_items'] = metadata.get('total_items', 0)
+            timestamp = metadata.get('processing_timestamp')
+            if timestamp:
+                # 'YYYY-MM-DD HH:MM' is the first 16 characters of an ISO-8601 stamp;
+                # anything else (including non-string values) is shown as is
+                if isinstance(timestamp, str) and len(timestamp) >= 16 and timestamp[10:11] in ('T', ' '):
+                    stats['processed_date'] = timestamp[:16].replace('T', ' ')
+                else:
+                    stats['processed_date'] = timestamp
+
+        # Count content types; mapping dict.get over the items keeps the whole
+        # count in C (Counter preserves first-seen order like the dict did)
+        content = data.get('content', [])
+        content_types = Counter(map(dict.get, content, itertools.repeat('type'),
+                                    itertools.repeat('text')))
 
-        if data.get('references'):
-            toc_items.append('<li><a href="#references-section">📚 References</a></li>')
+        if content_types:
+            stats['content_types'] = content_types
 
-        if not toc_items:
-            return ""
+        # Generate HTML
+        stat_items = []
+        for key, value in stats.items():
+            formatted_key = _STAT_KEY_LABELS.get(key) or key.replace('_', ' ').title()
+            if isinstance(value, dict):
+                # Handle nested stats like content_types
+                nested_items = '<br>'.join(map(_TYPE_SPAN, value.keys(), value.values()))
+                stat_items.append(
+                    f"<div class='stat-item'><strong>{formatted_key}:</strong><br>{nested_items}</div>"
+                )
+            else:
+                stat_items.append(f"<div class='stat-item'><strong>{formatted_key}:</strong> {value}</div>")
 
         return f"""
-        <div class="table-of-contents">
-            <h3>📑 Table of Contents</h3>
-            <ul>
-                {''.join(toc_items)}
-            </ul>
+        <div class="stats-card">
+            <h3>📊 Document Statistics</h3>
+            <div class="stats-grid">
+                {''.join(stat_items)}
+            </div>
         </div>
         """
 
-    def get_css_styles(self) -> str:
+    def generate_content_item(self, item: Dict, item_index: int = 0, out: Optional[List[str]] = None) -> Optional[str]:
         """
-        Get CSS styles for the HTML document.
+        Generate HTML for a single content item.
+
+        Args:
+            item: Content item dictionary
+            item_index: Index of the item for unique IDs
+            out: Optional fragment list to append the HTML to instead of returning it
 
         Returns:
-            CSS styles as string
+            HTML string for the content item, or None when appended to out
         """
-        return """
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
+        kind = _content_renderer_kind(item.get('type', 'text'))
 
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f8f9fa;
-        }
+        # Handle different content types
+        if kind == 'image' or 'base64_data' in item:
+            return self._generate_image_item(item, item_index, out)
+        elif kind == 'table':
+            return self._generate_table_item(item, item_index, out)
+        elif kind == 'list':
+            return self._generate_list_item(item, item_index, out)
+        else:
+            return self._generate_text_item(item, item_index, out)
 
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: white;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            border-radius: 8px;
-        }
+    def _generate_image_item(self, item: Dict, item_index: int, out: Optional[List[str]] = None) -> Optional[str]:
+        """Generate HTML for image items."""
+        # Check if this item has external image reference
+        image_filename = item.get('image_filename', '')
+        caption = item.get('caption', '')
+        label = item.get('label', f'image_{item_index}')
 
-        .header {
-            text-align: center;
-            margin-bottom: 2rem;
-            padding: 2rem 0;
-            border-bottom: 2px solid #e9ecef;
-        }
+        if image_filename:
+            # Use external image reference
+            parts = [
+                '\n        <div class="content-item image-item" id="', _esc(label), '">\n'
+                '            <div class="content-meta">🖼️ Image (Line ', str(item_index * 2 + 3), ')</div>\n'
+                '            <div class="image-container">\n'
+                '                <img src="', _esc(image_filename), '" alt="', _esc(caption or 'Document image'), '" loading="lazy">\n'
+                '            </div>\n'
+                '            ',
+            ]
+        else:
+            # Fallback to base64 data
+            img_data = item.get('base64_data', item.get('content', ''))
 
-        .header h1 {
-            color: #2c3e50;
-            font-size: 2.5rem;
-            margin-bottom: 0.5rem;
-        }
+            # Split into data URL prefix and payload so the payload is emitted
+            # as-is rather than copied into a concatenated URL
+            url_prefix, payload = self._split_base64_image(img_data)
 
-        .header .subtitle {
-            color: #6c757d;
-            font-size: 1.1rem;
-        }
+            if payload is None:
+                # Fallback for non-image content
+                return self._generate_text_item(item, item_index, out)
 
-        .document-info {
-            background: #f8f9fa;
-            padding: 1rem;
-            border-radius: 6px;
-            margin-bottom: 2rem;
-        }
+            # Raw base64 payloads were checked against the base64 alphabet; a
+            # data URL taken from the input still needs escaping for the attribute
+            if not url_prefix:
+                payload = _esc(payload)
 
-        .info-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1rem;
-        }
+            # Generate image HTML
+            parts = [
+                '\n        <div class="content-item image-item" id="', _esc(label), '">\n'
+                '            <div class="content-meta">\n'
+                '                <span class="item-type">🖼️ Image</span>\n'
+                '                <span class="item-label">', _esc(label), '</span>\n'
+                '            </div>\n'
+                '            <div class="image-container">\n'
+                '                <img src="', url_prefix, payload, '" alt="', _esc(caption or 'Document image'), '" loading="lazy">\n'
+                '            </div>\n'
+                '            ',
+            ]
+
+        if caption:
+            parts += ('<div class="image-caption">', self.format_text_content(caption), '</div>')
+        parts.append('\n        </div>\n        ')
+
+        return _emit(parts, out)
+
+    def _generate_table_item(self, item: Dict, item_index: int, out: Optional[List[str]] = None) -> Optional[str]:
+        """Generate HTML for table items."""
+        content = item.get('content', '')
+        caption = item.get('caption', '')
+        label = item.get('label', f'table_{item_index}')
 
-        .info-item {
-            background: white;
-            padding: 1rem;
-            border-radius: 4px;
-            border-left: 4px solid #007bff;
-        }
+        # Check if there's an external table image based on label
+        table_image_filename = None
+        if label and 'table_' in label:
+            # Extract table number from label (e.g., 'table_1' -> '1')
+            table_num = label.split('_')[-1]
+            table_image_filename = f"burns-table-{table_num}.png"
+        elif item_index < 4:  # We know there are 4 tables from processing
+            table_image_filename = f"burns-table-{item_index + 1}.png"
 
-        .stats-card {
-            background: #f8f9fa;
-            border: 1px solid #dee2e6;
-            border-radius: 6px;
-            padding: 1.5rem;
-            margin-bottom: 2rem;
-        }
+        # Generate table HTML with image reference if available
+        parts = [
+            '\n        <div class="content-item table-item" id="', _esc(label), '">\n'
+            '            <div class="content-meta">📊 Table (Line ', str(item_index * 2 + 3), ')</div>\n'
+            '            ',
+        ]
+        if caption:
+            parts += ('<div class="table-caption">', self.format_text_content(caption), '</div>')
+        parts += (
+            '\n            <div class="table-content">\n'
+            '                ',
+            # Try to parse table structure from content
+            self._parse_table_cached(content),
+            '\n            </div>\n'
+            '            ',
+        )
+        if table_image_filename:
+            parts += (
+                '<div class="table-image"><img src="', _esc(table_image_filename),
+                '" alt="Table ', str(item_index + 1), '" loading="lazy"></div>',
+            )
+        parts.append('\n        </div>\n        ')
 
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 1rem;
-        }
+        return _emit(parts, out)
 
-        .stat-item {
-            background: white;
-            padding: 1rem;
-            border-radius: 4px;
-            border-left: 4px solid #28a745;
-        }
+    def _parse_table_content(self, content: str) -> str:
+        """Parse table content and generate proper HTML table."""
+        if not content:
+            return "<p>No table content available</p>"
 
-        .stat-detail {
-            font-size: 0.9rem;
-            color: #6c757d;
-            display: block;
-            margin-top: 0.5rem;
-        }
+        # Check if content contains table cell information
+        if 'table_cells=' in content and 'num_rows=' in content and 'num_cols=' in content:
+            # Extract basic table info
+            rows_match = _RE_NUM_ROWS.search(content)
+            cols_match = _RE_NUM_COLS.search(content)
 
-        .content {
-            padding: 30px;
-        }
+            if rows_match and cols_match:
+                num_rows = int(rows_match.group(1))
+                num_cols = int(cols_match.group(1))
 
-        .section {
-            margin: 20px 0;
-            border: 1px solid #e9ecef;
-            border-radius: 10px;
-            overflow: hidden;
-        }
+                if num_rows > 0 and num_cols > 0:
+                    # Try to extract cell text from the content, stopping once the
+                    # grid is full
+                    cell_texts = list(itertools.islice(_iter_cell_texts(content), num_rows * num_cols))
 
-        .section-header {
-            background: #f8f9fa;
-            padding: 20px;
-            border-bottom: 1px solid #e9ecef;
-        }
+                    if cell_texts:
+                        return self._generate_html_table(cell_texts, num_rows, num_cols)
 
-        .section-title {
-            color: #2c3e50;
-            margin-bottom: 5px;
-        }
+        # Fallback: check if content looks like markdown table
+        if '|' in content and '\n' in content:
+            return self.convert_markdown_table_to_html(content)
 
-        .section-meta {
-            color: #666;
-            font-size: 0.9rem;
-            font-weight: normal;
-        }
+        # Final fallback: format as preformatted text
+        return f"<pre class='table-raw'>{self.format_text_content(content)}</pre>"
 
-        .section-stats {
-            padding: 15px 20px;
-            background: #f1f3f4;
-        }
+    def _generate_html_table(self, cell_texts: list, num_rows: int, num_cols: int) -> str:
+        """Generate HTML table from cell data."""
+        if not cell_texts or num_rows == 0 or num_cols == 0:
+            return "<p>Empty table</p>"
 
-        .section-stats details summary {
-            cursor: pointer;
-            font-weight: 500;
-            color: #555;
-        }
+        # Calculate expected cells
+        expected_cells = num_rows * num_cols
 
-        .mini-stats .stats-card {
-            margin: 10px 0;
-            padding: 15px;
-        }
+        # Pad or truncate cell_texts to match expected size
+        cell_texts = cell_texts[:expected_cells]
+        if len(cell_texts) < expected_cells:
+            cell_texts = cell_texts + [""] * (expected_cells - len(cell_texts))
 
-        .section-content {
-            padding: 20px;
-        }
+        # Format every cell in one map() pass, then emit each row with a single
+        # join using the closing/opening tag pair as separator
+        cells = list(map(self.format_text_content, cell_texts))
 
-        .content-item {
-            margin: 15px 0;
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #3498db;
-        }
+        # Table tags plus one entry per row
+        table_html = [''] * (num_rows + 2)
+        table_html[0] = '<table class="markdown-table">'
 
-        .text-item {
-            background: #f8f9fa;
-            border-left-color: #3498db;
-        }
+        for row in range(num_rows):
+            # First row is typically headers
+            tag = 'th' if row == 0 else 'td'
+            row_cells = f'</{tag}>\n    <{tag}>'.join(cells[row * num_cols:(row + 1) * num_cols])
+            table_html[row + 1] = f'  <tr>\n    <{tag}>{row_cells}</{tag}>\n  </tr>'
 
-        .image-item {
-            background: #e8f5e8;
-            border-left-color: #27ae60;
-        }
+        table_html[-1] = '</table>'
+        return '\n'.join(table_html)
 
-        .list-item {
-            background: #fff3cd;
-            border-left-color: #ffc107;
-        }
+    def _generate_list_item(self, item: Dict, item_index: int, out: Optional[List[str]] = None) -> Optional[str]:
+        """Generate HTML for list items."""
+        content = item.get('text', item.get('content', ''))
 
-        .heading-item {
-            background: #e7f3ff;
-            border-left-color: #007bff;
-        }
+        parts = [
+            '\n        <div class="content-item list-item">\n'
+            '            <div class="content-meta">📋 List (Line ', str(item_index * 2 + 3), ')</div>\n'
+            '            <div class="list-content">\n'
+            '                ', self.format_text_content(content), '\n'
+            '            </div>\n'
+            '        </div>\n'
+            '        ',
+        ]
 
-        .table-item {
-            background: #f0f8ff;
-            border-left-color: #8a2be2;
-        }
+        return _emit(parts, out)
 
-        .table-row-item {
-            background: #f5f5f5;
-            border-left-color: #999;
-        }
+    def _generate_text_item(self, item: Dict, item_index: int, out: Optional[List[str]] = None) -> Optional[str]:
+        """Generate HTML for text items."""
+        content = item.get('text', item.get('content', ''))
+        content_type = item.get('type', 'text').lower()
 
-        .content-meta {
-            font-size: 0.8rem;
-            color: #666;
-            margin-bottom: 10px;
-            font-weight: 500;
-        }
+        # Determine if this is a heading based on the type field
+        is_heading = 'header' in content_type or 'heading' in content_type or content_type == 'sectionheaderitem'
 
-        .text-content {
-            line-height: 1.7;
-        }
+        if is_heading:
+            # Generate heading item
+            heading_level = str(self._determine_heading_level(content, item))
+            heading_id = self._generate_heading_id(content)
 
-        .text-content code {
-            background: #f8f9fa;
-            padding: 0.2rem 0.4rem;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-        }
+            parts = [
+                '\n            <div class="content-item heading-item depth-', heading_level, '" id="', heading_id, '">\n'
+                '                <div class="content-meta">\n'
+                '                    <span class="item-type">📑 Heading ', heading_level, '</span>\n'
+                '                </div>\n'
+                '                <h', heading_level, ' class="content-heading">', self.format_text_content(content),
+                '</h', heading_level, '>\n'
+                '            </div>\n'
+                '            ',
+            ]
+        else:
+            # Generate regular text item; line number is based on item index
+            parts = [
+                '\n        <div class="content-item text-item">\n'
+                '            <div class="content-meta">📄 Text (Line ', str(item_index * 2 + 3), ')</div>\n'
+                '            <div class="text-content">', self.format_text_content(content), '</div>\n'
+                '        </div>\n'
+                '        ',
+            ]
 
-        .text-content a {
-            color: #007bff;
-            text-decoration: none;
-        }
+        return _emit(parts, out)
 
-        .text-content a:hover {
-            text-decoration: underline;
-        }
+    def _determine_heading_level(self, content: str, item: Dict) -> int:
+        """Determine heading level based on content and hierarchy."""
+        # Check section hierarchy if available
+        hierarchy = item.get('section_hierarchy', [])
+        if hierarchy:
+            level = len(hierarchy)
+            return min(max(level, 1), 6)  # HTML only supports h1-h6, minimum h1
 
-        .markdown-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 1rem 0;
-            font-size: 0.9rem;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
+        # Fallback to content analysis for better semantic structure
+        if content.isupper() and len(content) > 20:
+            return 1  # Main sections
+        elif content.endswith(':'):
+            return 2  # Subsections
+        elif len(content) > 50:
+            return 2  # Longer descriptive headers
+        else:
+            return 3  # Minor headings
 
-        .markdown-table th {
-            background: #f8f9fa;
-            font-weight: 600;
-            padding: 12px;
-            text-align: left;
-            border-bottom: 2px solid #dee2e6;
-        }
+    def _generate_heading_id(self, content: str) -> str:
+        """Generate a valid HTML ID from heading content."""
+        # Clean and normalize the content
+        clean_content = content.lower()
+        if clean_content.isascii():
+            # One translate pass, then collapse dash runs and trim the ends
+            parts = clean_content.translate(_HEADING_ID_TABLE).split('-')
+            clean_content = '-'.join(filter(None, parts))
+        else:
+            clean_content = _RE_HID_STRIP.sub('', clean_content)
+            clean_content = _RE_HID_DASH.sub('-', clean_content).strip('-')
+        return clean_content or 'heading'
 
-        .markdown-table td {
-            padding: 12px;
-            border-bottom: 1px solid #dee2e6;
-        }
+    def generate_section(self, section_name: str, items: List[Dict], section_type: str = "content", depth: int = 0) -> str:
+        """
+        Generate HTML for a complete section with all its items.
 
-        .markdown-table tbody tr:nth-of-type(even) {
-            background: #f8f9fa;
-        }
+        Args:
+            section_name: Name of the section
+            items: List of items in the section
+            section_type: Type of section (content, tables, images, references)
+            depth: Hierarchy depth for CSS classes
 
-        .markdown-table tbody tr:hover {
-            background: #e3f2fd;
-            cursor: pointer;
-        }
+        Returns:
+            HTML string for the complete section
+        """
+        buf = io.StringIO()
+        self.write_section(buf, section_name, items, section_type, depth)
+        return buf.getvalue()
 
-        .markdown-table tbody tr:last-of-type td {
-            border-bottom: none;
-        }
+    def write_section(self, fp: TextIO, section_name: str, items: List[Dict], section_type: str = "content", depth: int = 0) -> None:
+        """
+        Write HTML for a complete section to a text stream, one item at a time.
 
-        .list-content {
-            line-height: 1.7;
-        }
+        Args:
+            fp: Writable text stream (open file or io.StringIO)
+            section_name: Name of the section
+            items: List of items in the section
+            section_type: Type of section (content, tables, images, references)
+            depth: Hierarchy depth for CSS classes
+        """
+        if not items:
+            return
 
-        .content-heading {
-            color: #2c3e50;
-        }
+        # Count content types for stats in a single pass over the items
+        content_types = Counter(item.get('type', 'unknown') for item in items)
 
-        .image-container {
-            text-align: center;
-        }
+        # Generate section statistics
+        item_count = len(items)
+        text_count = content_types['textitem']
+        list_count = content_types['listitem']
+        table_count = content_types['tableitem']
+        image_count = content_types['imageitem']
 
-        .image-container img {
-            max-width: 100%;
-            height: auto;
-            border-radius: 6px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-            transition: transform 0.3s ease;
-        }
+        # Generate content types breakdown
+        content_types_html = _content_types_html(content_types)
 
-        .image-container img:hover {
-            transform: scale(1.02);
-        }
+        # Generate mini stats for this section
+        mini_stats_html = _SECTION_STATS_FMT.format(
+            total=item_count,
+            types=content_types_html,
+            images=image_count,
+            text=text_count,
+            lists=list_count,
+            tables=table_count,
+        ) if self.include_stats else ""
+
+        write = fp.write
+        write(_SECTION_HEAD_FMT.format(
+            depth_class=_depth_class(depth),
+            name=_esc(str(section_name)),
+            line_meta=_SECTION_LINE_META.format(item_count),
+            stats=mini_stats_html,
+        ))
+
+        # Write each item as soon as it is rendered
+        if section_type == 'images':
+            render_item = self._generate_image_item
+        elif section_type == 'tables':
+            render_item = self._generate_table_item
+        else:
+            render_item = self.generate_content_item
+        out: List[str] = []
+        writelines = fp.writelines
+        clear = out.clear
+        for i, item in enumerate(items):
+            render_item(item, i, out)
+            writelines(out)
+            clear()
 
-        .image-error {
-            background: #f8d7da;
-            color: #721c24;
-            padding: 1rem;
-            border-radius: 4px;
-            text-align: center;
-            border: 1px solid #f5c6cb;
-        }
+        write(_SECTION_FOOTER)
 
-        .image-caption {
-            margin-top: 0.5rem;
-            font-style: italic;
-            color: #6c757d;
-            text-align: center;
-        }
+    def generate_table_of_contents(self, data: Dict) -> str:
+        """
+        Generate table of contents from document structure.
 
-        .table-of-contents {
-            background: #f8f9fa;
-            padding: 1.5rem;
-            border-radius: 6px;
-            margin-bottom: 2rem;
-        }
+        Args:
+            data: Structured document data
 
-        .table-of-contents ul {
-            list-style: none;
-            padding-left: 0;
-        }
+        Returns:
+            HTML string for table of contents
+        """
+        if not self.include_toc:
+            return ""
 
-        .table-of-contents li {
-            margin: 0.5rem 0;
-        }
+        toc_items = []
 
-        .table-of-contents a {
-            color: #007bff;
-            text-decoration: none;
-            padding: 0.5rem;
-            display: block;
-            border-radius: 4px;
-            transition: background-color 0.3s ease;
-        }
+        # Add sections based on available data
+        if data.get('content'):
+            toc_items.append('<li><a href="#content-section">📄 Content</a></li>')
 
-        .table-of-contents a:hover {
-            background: #dee2e6;
-        }
+        if data.get('tables'):
+            toc_items.append('<li><a href="#tables-section">📊 Tables</a></li>')
 
-        .depth-0 {}
-        .depth-1 {}
-        .depth-2 {}
-        .depth-3 {}
-        .depth-4 {}
-        .depth-5 {}
+        if data.get('images'):
+            toc_items.append('<li><a href="#images-section">🖼️ Images</a></li>')
 
-        .footer {
-            text-align: center;
-            margin-top: 3rem;
-            padding: 2rem 0;
-            border-top: 1px solid #e9ecef;
-            color: #6c757d;
-        }
+        if data.get('references'):
+            toc_items.append('<li><a href="#references-section">📚 References</a></li>')
 
-        @media (max-width: 768px) {
-            body {
-                padding: 10px;
-            }
+        if not toc_items:
+            return ""
 
-            .header h1 {
-                font-size: 2rem;
-            }
+        return f"""
+        <div class="table-of-contents">
+            <h3>📑 Table of Contents</h3>
+            <ul>
+                {''.join(toc_items)}
+            </ul>
+        </div>
+        """
 
-            .content {
-                padding: 0;
-            }
+    def get_css_styles(self) -> str:
+        """
+        Get CSS styles for the HTML document.
 
-            .depth-1, .depth-2, .depth-3, .depth-4, .depth-5 {
-                margin-left: 0.5rem;
-            }
-        }
+        Returns:
+            CSS styles as string
         """
+        return _CSS_STYLES
 
     def generate_html_document(self, data: Dict, title: str = "Document Visualization") -> str:
         """
@@ -1023,107 +1408,127 @@ class HTMLGenerator:
         Returns:
             Complete HTML document string
         """
+        return ''.join(self.iter_html_document(data, title))
+
+    def write_html_document(self, data: Dict, out: TextIO, title: str = "Document Visualization") -> None:
+        """
+        Write the complete HTML document to a text stream, section by section.
+
+        Args:
+            data: Structured document data
+            out: Writable text stream (open file, socket wrapper or io.StringIO)
+            title: Document title for HTML head
+        """
+        out.writelines(self.iter_html_document(data, title))
+
+    def iter_html_document(self, data: Dict, title: str = "Document Visualization",
+                           stylesheet_href: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the HTML document fragment by fragment, so it can be streamed to a file.
+
+        Args:
+            data: Structured document data
+            title: Document title for HTML head
+            stylesheet_href: Optional URL of an external stylesheet to link
+                instead of inlining the CSS
+
+        Yields:
+            Consecutive fragments of the complete HTML document
+        """
+        return self._iter_document_chunks(data, title, stylesheet_href, _DOC_SKELETON)
+
+    def _iter_document_chunks(self, data: Dict, title: str, stylesheet_href: Optional[str],
+                              skeleton: Tuple[Union[str, bytes], ...]) -> Iterator[Union[str, bytes]]:
+        """
+        Yield the document with the static head and footer taken from skeleton.
+
+        generate() passes the pre-encoded _DOC_SKELETON_BYTES so the stylesheet
+        is not re-encoded for every file; iter_html_document passes the str form.
+        """
+        head_open, style_block, footer = skeleton
+
         # Extract document metadata
         metadata = data.get('metadata', {})
         total_items = metadata.get('total_items', 0)
         timestamp = metadata.get('processing_timestamp', '')
 
         # Organize content by document sections
-        sections_content = self._organize_content_by_sections(data)
-
-        # Generate complete HTML document
-        html_document = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{title}</title>
-            <style>
-                {self.get_css_styles()}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>📄 {title}</h1>
-                    <div class="subtitle">Generated on {timestamp}</div>
-                </div>
-
-                <div class="document-info">
-                    <div class="info-grid">
-                        <div class="info-item">
-                            <strong>Total Items:</strong> {total_items}
-                        </div>
-                        <div class="info-item">
-                            <strong>Sections:</strong> {len(sections_content)}
-                        </div>
-                    </div>
-                </div>
+        sections = self._group_items_by_section(data)
+
+        # Fill in the precompiled document skeleton around the sections
+        title = _esc(title)
+        yield head_open
+        yield title
+        if stylesheet_href:
+            yield _DOC_LINK_BLOCK(_esc(stylesheet_href), _DOC_BODY_OPEN)
+        else:
+            yield style_block
+        yield _DOC_HEADER_TEMPLATE.substitute(
+            title=title,
+            timestamp=_esc(str(timestamp)),
+            total_items=total_items,
+            section_count=len(sections),
+            stats_card=self.generate_stats_card(data),
+        )
+        for section_index, (section_name, items, source_types) in enumerate(sections):
+            if _has_inline_image(items):
+                # Stream the fragments so inline image payloads reach the sink
+                # without being copied into a joined section string
+                yield from self._iter_document_section(section_name, items, section_index, source_types)
+            else:
+                yield self._generate_document_section(section_name, items, section_index, source_types)
+        yield footer
 
-                {self.generate_stats_card(data)}
+    def _organize_content_by_sections(self, data: Dict) -> List[str]:
+        """
+        Organize all content by document sections rather than data type.
 
-                <div class="content">
-                    {sections_content}
-                </div>
+        Args:
+            data: Structured document data
 
-                <div class="footer">
-                    <p>Generated by Chunk Monkey HTML Generator</p>
-                </div>
-            </div>
-        </body>
-        </html>
+        Returns:
+            List of section HTML fragments in document order, left unjoined so
+            the caller can splice them into its own output
         """
+        return [
+            self._generate_document_section(section_name, items, section_index, source_types)
+            for section_index, (section_name, items, source_types)
+            in enumerate(self._group_items_by_section(data))
+        ]
 
-        return html_document
-
-    def _organize_content_by_sections(self, data: Dict) -> str:
+    def _group_items_by_section(self, data: Dict) -> List[Tuple[str, List[Dict], List[str]]]:
         """
-        Organize all content by document sections rather than data type.
+        Group content, table, image and reference items by their parent_section.
 
         Args:
             data: Structured document data
 
         Returns:
-            HTML string with content organized by document structure
+            List of (section_name, items, source_types) in document order, where
+            source_types[i] records which list items[i] came from; every
+            section has at least one item
         """
-        # Collect all items with their section information
-        all_items = []
-
-        # Add content items
-        for item in data.get('content', []):
-            all_items.append({**item, 'source_type': 'content'})
-
-        # Add table items
-        for item in data.get('tables', []):
-            all_items.append({**item, 'source_type': 'table'})
-
-        # Add image items
-        for item in data.get('images', []):
-            all_items.append({**item, 'source_type': 'image'})
-
-        # Add reference items
-        for item in data.get('references', []):
-            all_items.append({**item, 'source_type': 'reference'})
-
-        # Group items by their parent_section
-        sections = {}
-        for item in all_items:
-            section_name = item.get('parent_section', 'Unknown Section')
-            if section_name not in sections:
-                sections[section_name] = []
-            sections[section_name].append(item)
-
-        # Generate HTML for each section
-        sections_html = []
-        for section_index, (section_name, items) in enumerate(sections.items()):
-            if items:  # Only generate sections that have content
-                section_html = self._generate_document_section(section_name, items, section_index)
-                sections_html.append(section_html)
-
-        return "".join(sections_html)
-
-    def _generate_document_section(self, section_name: str, items: List[Dict], section_index: int = 0) -> str:
+        # Single pass over each source list. The source is recorded in a list
+        # alongside the items rather than written into them, so neither the
+        # input (which may be a cached document) is mutated nor every item
+        # dict copied. A section is only created when its first item arrives,
+        # so no empty sections are produced.
+        sections = []
+        buckets = {}
+        for source_key, source_type in _SOURCE_TYPES:
+            for item in data.get(source_key, ()):
+                section_name = item.get('parent_section', 'Unknown Section')
+                bucket = buckets.get(section_name)
+                if bucket is None:
+                    bucket = buckets[section_name] = ([], [])
+                    sections.append((section_name, *bucket))
+                bucket[0].append(item)
+                bucket[1].append(source_type)
+
+        return sections
+
+    def _generate_document_section(self, section_name: str, items: List[Dict], section_index: int = 0,
+                                   source_types: Optional[List[str]] = None) -> str:
         """
         Generate HTML for a document section with all its content.
 
@@ -1131,88 +1536,93 @@ class HTMLGenerator:
             section_name: Name of the document section
             items: All items belonging to this section
             section_index: Index of the section for line numbering
+            source_types: Source list of each item (defaults to each item's 'source_type')
 
         Returns:
             HTML string for the section
         """
+        return ''.join(self._iter_document_section(section_name, items, section_index, source_types))
+
+    def _iter_document_section(self, section_name: str, items: List[Dict], section_index: int = 0,
+                               source_types: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Yield the HTML for a document section: header and stats, each item, then the closing tags.
+
+        Args:
+            section_name: Name of the document section
+            items: All items belonging to this section
+            section_index: Index of the section for line numbering
+            source_types: Source list of each item (defaults to each item's 'source_type')
+
+        Yields:
+            Consecutive fragments of the section HTML
+        """
+        if source_types is None:
+            source_types = [item.get('source_type') for item in items]
+
         # Determine section depth from first item's hierarchy
         depth = 0
         if items:
             hierarchy = items[0].get('section_hierarchy', [])
             depth = len(hierarchy) - 1 if hierarchy else 0
 
-        # Count different types of content using source_type and item_type
-        text_count = len([i for i in items if i.get('type') == 'textitem' or (i.get('source_type') == 'content' and 'text' in i.get('type', ''))])
-        table_count = len([i for i in items if i.get('source_type') == 'table' or i.get('item_type') == 'tableitem'])
-        image_count = len([i for i in items if i.get('source_type') == 'image' or i.get('item_type') == 'pictureitem'])
-        list_count = len([i for i in items if i.get('type') == 'listitem'])
-
-        # Count content types for stats
+        # Count different types of content using source_type and item_type,
+        # together with the content type breakdown, in a single pass
+        text_count = table_count = image_count = list_count = 0
         content_types = {}
-        for item in items:
+        for item, source_type in zip(items, source_types):
+            content_type = item.get('type')
+            original_type = item.get('item_type')
+
+            if content_type == 'textitem' or (source_type == 'content' and content_type and 'text' in content_type):
+                text_count += 1
+            if source_type == 'table' or original_type == 'tableitem':
+                table_count += 1
+            if source_type == 'image' or original_type == 'pictureitem':
+                image_count += 1
+            if content_type == 'listitem':
+                list_count += 1
+
             # Use source_type first, then fall back to type or item_type
-            item_type = item.get('source_type')
-            if not item_type:
-                item_type = item.get('type') or item.get('item_type', 'unknown')
+            item_type = source_type or content_type or item.get('item_type', 'unknown')
             content_types[item_type] = content_types.get(item_type, 0) + 1
 
         # Generate content types breakdown
-        content_types_html = ""
-        if content_types:
-            type_details = []
-            for item_type, count in content_types.items():
-                display_type = item_type.replace('item', '') if item_type.endswith('item') else item_type
-                type_details.append(f"<span class='stat-detail'>{display_type}: {count}</span>")
-            content_types_html = "<br>".join(type_details)
-
-        # Generate section statistics
-        stats_html = f"""
-    <div class="stats-card">
-        <h3>📊 Document Statistics</h3>
-        <div class="stats-grid">
-            <div class='stat-item'><strong>Total Items:</strong> {len(items)}</div><div class='stat-item'><strong>Content Types:</strong><br>{content_types_html}</div><div class='stat-item'><strong>Image Count:</strong> {image_count}</div><div class='stat-item'><strong>Text Blocks:</strong> {text_count}</div><div class='stat-item'><strong>List Items:</strong> {list_count}</div><div class='stat-item'><strong>Table Rows:</strong> {table_count}</div><div class='stat-item'><strong>Subsection Count:</strong> 0</div>
-        </div>
-    </div>
-    """
+        content_types_html = _content_types_html(content_types)
+
+        # Section header and statistics
+        stats_html = _SECTION_STATS_FMT.format(
+            total=len(items),
+            types=content_types_html,
+            images=image_count,
+            text=text_count,
+            lists=list_count,
+            tables=table_count,
+        )
+        yield _SECTION_HEAD_FMT.format(
+            depth_class=_depth_class(depth),
+            name=_esc(str(section_name)),
+            line_meta=_SECTION_LINE_META.format(section_index * 2 + 1),
+            stats=stats_html,
+        )
 
-        # Generate content HTML
-        items_html = []
-        for i, item in enumerate(items):
-            source_type = item.get('source_type', 'content')
+        # Generate content HTML one item at a time, yielding its fragments
+        out: List[str] = []
+        clear = out.clear
+        render_image = self._generate_image_item
+        render_table = self._generate_table_item
+        render_content = self.generate_content_item
+        for i, (item, source_type) in enumerate(zip(items, source_types)):
             if source_type == 'image':
-                items_html.append(self._generate_image_item(item, i))
+                render_image(item, i, out)
             elif source_type == 'table':
-                items_html.append(self._generate_table_item(item, i))
+                render_table(item, i, out)
             else:
-                items_html.append(self.generate_content_item(item, i))
-
-        # Generate section HTML
-        section_html = f"""
-    <div class="section depth-{depth}">
-        <div class="section-header">
-            <h2 class="section-title">{section_name}</h2>
-            <span class="section-meta">Line {section_index * 2 + 1} • Level 2</span>
-        </div>
-
-        <div class="section-stats">
-            <details>
-                <summary>📈 Section Statistics</summary>
-                <div class="mini-stats">
-                    {stats_html}
-                </div>
-            </details>
-        </div>
-
-
-        <div class="section-content">
-            {"".join(items_html)}
-        </div>
-
-
-    </div>
-    """
+                render_content(item, i, out)
+            yield from out
+            clear()
 
-        return section_html
+        yield _SECTION_FOOTER
 
     def generate(self, data: Dict, output_path: str, title: str = "Document Visualization") -> None:
         """
@@ -1227,18 +1637,39 @@ class HTMLGenerator:
             Exception: If HTML generation or file writing fails
         """
         try:
-            # Generate HTML document
-            html_content = self.generate_html_document(data, title)
+            # Reference a shared stylesheet next to the output instead of
+            # inlining it, if configured
+            stylesheet_href = None
+            if self.external_css:
+                self._ensure_assets(Path(output_path).parent)
+                stylesheet_href = _CSS_ASSET_PATH
 
-            # Write to file
-            self.file_manager.write_text_file(output_path, html_content)
+            # Stream the HTML document to file as it is generated
+            self.file_manager.write_text_stream(
+                output_path,
+                self._iter_document_chunks(data, title, stylesheet_href, _DOC_SKELETON_BYTES))
 
-            logger.info(f"HTML visualization generated: {output_path}")
+            logger.info("HTML visualization generated: %s", output_path)
 
         except Exception as e:
-            logger.error(f"Error generating HTML: {e}")
+            logger.error("Error generating HTML: %s", e)
             raise
 
+    def _ensure_assets(self, output_dir: Path) -> None:
+        """
+        Write the shared stylesheet into output_dir once per process.
+
+        Args:
+            output_dir: Directory holding the generated HTML files
+        """
+        key = str(output_dir.resolve())
+        if key in HTMLGenerator._assets_written:
+            return
+        css_path = output_dir / _CSS_ASSET_PATH
+        if not css_path.exists() or css_path.read_text(encoding='utf-8') != _CSS_STYLES:
+            self.file_manager.write_text_file(css_path, _CSS_STYLES)
+        HTMLGenerator._assets_written.add(key)
+
     def generate_from_json_file(self, json_path: str, output_path: Optional[str] = None,
                                title: Optional[str] = None) -> str:
         """
@@ -1253,45 +1684,210 @@ class HTMLGenerator:
             Path to generated HTML file
 
         Raises:
-            Exception: If processing fails
+            FileNotFoundError: If the JSON file does not exist
+            ValueError: If the JSON file is empty or cannot be loaded
         """
-        try:
-            # Load JSON data
-            data = self.load_json_document(json_path)
-            if not data:
-                raise ValueError("Failed to load JSON document")
+        # Validate the input up front instead of unwinding through a handler
+        json_file = Path(json_path)
+        json_stat = json_file.stat()
+        if json_stat.st_size == 0:
+            raise ValueError(f"JSON file is empty: {json_path}")
+
+        # Determine output path
+        if not output_path:
+            output_path = json_file.parent / f"{json_file.stem}.html"
+
+        # Determine title
+        if not title:
+            title = _title_from_stem(json_file.stem)
+
+        # In incremental mode, skip files whose output was produced from the
+        # same input, title and generator configuration and has not been
+        # rewritten since (the output's own mtime and size are in the stamp)
+        stamp_path = Path(f"{output_path}.stamp")
+        if self.incremental and stamp_path.exists():
+            try:
+                output_stat = os.stat(output_path)
+            except FileNotFoundError:
+                output_stat = None
+            if output_stat is not None and stamp_path.read_text(encoding='utf-8') == \
+                    self._build_stamp(json_stat, title, output_stat):
+                logger.info("HTML up to date, skipping: %s", output_path)
+                return str(output_path)
+
+        # Load JSON data
+        data = self.load_json_document(json_path)
+        if not data:
+            raise ValueError(f"Failed to load JSON document: {json_path}")
+
+        # Generate HTML; generate() logs its own write failures
+        self.generate(data, str(output_path), title)
+
+        if self.incremental:
+            stamp = self._build_stamp(json_stat, title, os.stat(output_path))
+            self.file_manager.write_text_file(stamp_path, stamp)
+
+        return str(output_path)
+
+    def _build_stamp(self, json_stat: os.stat_result, title: str,
+                     output_stat: os.stat_result) -> str:
+        """
+        Fingerprint everything an incremental build's output depends on.
 
-            # Determine output path
-            if not output_path:
-                json_file = Path(json_path)
-                output_path = json_file.parent / f"{json_file.stem}.html"
+        Args:
+            json_stat: stat() result of the input JSON file
+            title: Document title
+            output_stat: stat() result of the HTML file the stamp vouches for
 
-            # Determine title
-            if not title:
-                title = Path(json_path).stem.replace('_', ' ').title()
+        Returns:
+            Hex digest of the input's and output's mtime and size, the title,
+            the generator config and the mtime of this module
+        """
+        key = json.dumps([
+            json_stat.st_mtime_ns,
+            json_stat.st_size,
+            output_stat.st_mtime_ns,
+            output_stat.st_size,
+            title,
+            self.config,
+            _MODULE_MTIME_NS,
+        ], sort_keys=True, default=str)
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
 
-            # Generate HTML
-            self.generate(data, str(output_path), title)
 
-            return str(output_path)
+# Shared default-configured generator for the convenience functions, created on
+# first use so its caches carry over between calls
+_default_generator: Optional[HTMLGenerator] = None
 
-        except Exception as e:
-            logger.error(f"Error generating HTML from JSON file: {e}")
-            raise
+
+def _get_default_generator() -> HTMLGenerator:
+    """Return the shared default-configured HTMLGenerator, creating it if needed."""
+    global _default_generator
+    if _default_generator is None:
+        _default_generator = HTMLGenerator()
+    return _default_generator
 
 
 # Convenience functions for direct use
 def generate_html(data: Dict, output_path: str, title: str = "Document Visualization") -> None:
     """Convenience function to generate HTML from structured data."""
-    generator = HTMLGenerator()
-    generator.generate(data, output_path, title)
+    _get_default_generator().generate(data, output_path, title)
 
 
 def generate_html_from_json(json_path: str, output_path: Optional[str] = None,
                            title: Optional[str] = None) -> str:
     """Convenience function to generate HTML from JSON file."""
-    generator = HTMLGenerator()
-    return generator.generate_from_json_file(json_path, output_path, title)
+    return _get_default_generator().generate_from_json_file(json_path, output_path, title)
+
+
+def _generate_html_worker(json_path: str, output_path: Optional[str]) -> str:
+    """Process-pool entry point; each worker reuses its own default generator."""
+    return _get_default_generator().generate_from_json_file(json_path, output_path)
+
+
+def generate_html_many(json_paths: Iterable[str], output_dir: Optional[str] = None,
+                       max_workers: Optional[int] = None) -> List[str]:
+    """
+    Generate HTML for many JSON files in parallel worker processes.
+
+    Args:
+        json_paths: Paths to input JSON files
+        output_dir: Optional directory for the HTML files (defaults to next to each JSON)
+        max_workers: Number of worker processes (defaults to PerformanceConfig.MAX_WORKERS)
+
+    Returns:
+        Paths to the generated HTML files, in input order
+
+    Raises:
+        ValueError: If output_dir is given and two inputs share a file stem
+    """
+    json_paths = [str(path) for path in json_paths]
+    if output_dir:
+        out_dir = Path(output_dir)
+        stems = Counter(Path(path).stem for path in json_paths)
+        duplicates = sorted(stem for stem, count in stems.items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Inputs would overwrite each other in {out_dir}: {', '.join(duplicates)}")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        output_paths = [str(out_dir / f"{Path(path).stem}.html") for path in json_paths]
+    else:
+        output_paths = [None] * len(json_paths)
+
+    # Only paths cross the process boundary; parsing and rendering happen in
+    # the workers, whose generator caches persist across their files
+    if not PerformanceConfig.PARALLEL_PROCESSING or len(json_paths) < 2:
+        return list(map(_generate_html_worker, json_paths, output_paths))
+
+    # Imported here so single-file use of this module does not pay for it
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = max_workers or PerformanceConfig.MAX_WORKERS
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(json_paths) // (workers * 4))
+        return list(executor.map(_generate_html_worker, json_paths, output_paths,
+                                 chunksize=chunksize))
+
+
+def serve_html(host: str = '127.0.0.1', port: int = 8000) -> None:
+    """
+    Serve HTML rendering over HTTP with one warm generator.
+
+    POST a structured JSON document to /render (optionally ?title=...) and
+    the response is the rendered HTML. Imports, compiled templates and the
+    generator caches stay hot across requests instead of being rebuilt per
+    process. Requests are handled one at a time because the generator's
+    caches are not thread-safe.
+
+    Args:
+        host: Interface to bind
+        port: TCP port to listen on
+    """
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    generator = _get_default_generator()
+
+    class _RenderHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            url = urlsplit(self.path)
+            if url.path != '/render':
+                self.send_error(404, "Unknown endpoint")
+                return
+
+            length_header = self.headers.get('Content-Length', '')
+            if not length_header.isdigit():
+                self.send_error(400, "Missing or invalid Content-Length")
+                return
+
+            try:
+                data = json.loads(self.rfile.read(int(length_header)))
+            except ValueError as e:
+                self.send_error(400, f"Invalid JSON: {e}")
+                return
+            if not isinstance(data, dict):
+                self.send_error(400, "Expected a JSON object")
+                return
+
+            title = parse_qs(url.query).get('title', ["Document Visualization"])[0]
+            try:
+                body = generator.generate_html_document(data, title).encode('utf-8')
+            except Exception as e:
+                logger.error("Error rendering HTML: %s", e)
+                self.send_error(500, "Error rendering HTML")
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.info("%s - " + format, self.address_string(), *args)
+
+    with HTTPServer((host, port), _RenderHandler) as server:
+        logger.info("Serving HTML rendering on http://%s:%d/render", host, port)
+        server.serve_forever()
 
 
 def main():
@@ -1305,12 +1901,17 @@ def main():
     parser.add_argument('-t', '--title', help='Document title')
     parser.add_argument('--theme', choices=['modern', 'classic', 'minimal'],
                        default='modern', help='HTML theme')
+    parser.add_argument('--external-css', action='store_true',
+                       help='Link a shared assets/chunkmonkey.css instead of inlining the styles')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Skip generation when the HTML is up to date with the JSON')
 
     args = parser.parse_args()
 
     try:
         # Configure generator
-        config = {'theme': args.theme}
+        config = {'theme': args.theme, 'external_css': args.external_css,
+                  'incremental': args.incremental}
         generator = HTMLGenerator(config)
 
         # Generate HTML
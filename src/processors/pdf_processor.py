@@ -18,24 +18,50 @@ import json
 import base64
 import re
 import logging
+import functools
+import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.datamodel.base_models import InputFormat
 from docling_core.types.doc import PictureItem, TableItem, TextItem, ListItem, ImageRefMode
+from PIL import Image
 
 try:
-    from ..config.settings import PDFProcessingConfig, JSONConfig, LoggingConfig
+    from docling_core.types.doc import SectionHeaderItem
+except ImportError:
+    SectionHeaderItem = None
+
+try:
+    # Optional SIMD base64 codec for decoding embedded picture data
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+# Decoder for the embedded PNGs this module writes out; both accept validate=
+_b64decode = pybase64.b64decode if pybase64 is not None else base64.b64decode
+
+try:
+    # Optional native JSON encoder; the stdlib json module is used otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ..config.settings import PDFProcessingConfig, JSONConfig, LoggingConfig, PerformanceConfig
     from ..utils.text_utils import TextProcessor
     from ..utils.file_utils import FileManager
 except ImportError:
     # Handle both relative and absolute imports
     try:
-        from config.settings import PDFProcessingConfig, JSONConfig, LoggingConfig
+        from config.settings import PDFProcessingConfig, JSONConfig, LoggingConfig, PerformanceConfig
         from utils.text_utils import TextProcessor
         from utils.file_utils import FileManager
     except ImportError:
@@ -45,7 +71,7 @@ except ImportError:
         src_path = Path(__file__).parent.parent
         if str(src_path) not in sys.path:
             sys.path.insert(0, str(src_path))
-        from config.settings import PDFProcessingConfig, JSONConfig, LoggingConfig
+        from config.settings import PDFProcessingConfig, JSONConfig, LoggingConfig, PerformanceConfig
         from utils.text_utils import TextProcessor
         from utils.file_utils import FileManager
 
@@ -56,6 +82,108 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Reference-section heading matcher, compiled once from the configured keywords
+_REF_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, PDFProcessingConfig.REFERENCE_KEYWORDS)) + r')\b',
+    re.IGNORECASE
+)
+
+# Keywords that mark a main section header, matched as substrings of the
+# lowercased heading text in a single pass
+_MAIN_KEYWORDS = frozenset([
+    'abstract', 'introduction', 'methods', 'methodology', 'results',
+    'discussion', 'conclusion', 'references', 'bibliography',
+    'acknowledgments', 'appendix', 'background', 'literature review',
+    'analysis', 'findings', 'implications', 'limitations'
+])
+_MAIN_KEYWORD_RE = re.compile('|'.join(map(re.escape, sorted(_MAIN_KEYWORDS))))
+
+# Substrings of a lowercased item type name that mark a heading item
+_HEADER_TYPE_TOKENS = ('header', 'heading', 'section')
+
+
+def _is_header_type(item_type: str) -> bool:
+    """Return True if a lowercased item type name denotes a heading."""
+    return any(token in item_type for token in _HEADER_TYPE_TOKENS)
+
+
+# Output categories of the structured JSON, in file order
+_CATEGORIES = ("content", "tables", "images", "references")
+
+# PIL image modes the PNG encoder can write as is
+_PNG_MODES = frozenset(("1", "L", "LA", "P", "RGB", "RGBA", "I", "I;16"))
+
+# Section summary count key for each category
+_COUNT_KEYS = {
+    "content": "content_count",
+    "tables": "table_count",
+    "images": "image_count",
+    "references": "reference_count"
+}
+
+# Docling heading classes, checked with isinstance before any name matching
+_HEADER_CLASSES = tuple(cls for cls in (SectionHeaderItem,) if cls is not None)
+
+
+@functools.lru_cache(maxsize=64)
+def _type_name(cls: type) -> str:
+    """Return the lowercased class name used as an item type string."""
+    return cls.__name__.lower()
+
+
+@functools.lru_cache(maxsize=1024)
+def _section_lower(section: str) -> str:
+    """Return the lowercased section name, computed once per distinct section."""
+    return section.lower()
+
+
+@functools.lru_cache(maxsize=64)
+def _is_header_class(cls: type) -> bool:
+    """Return True if items of this class are headings (memoized per class)."""
+    return issubclass(cls, _HEADER_CLASSES) or _is_header_type(_type_name(cls))
+
+
+def _unchanged_png_bytes(item: Any, max_dimension: int) -> Optional[bytes]:
+    """
+    Return a picture's embedded PNG bytes if they can be written out unchanged.
+
+    Args:
+        item: PictureItem whose image reference to inspect
+        max_dimension: Largest width/height that is saved without resizing
+
+    Returns:
+        Decoded PNG bytes from the item's data URI, or None if the image is not
+        an embedded PNG, its size is unknown, or it needs resizing
+    """
+    image_ref = getattr(item, 'image', None)
+    if image_ref is None or getattr(image_ref, 'mimetype', None) != 'image/png':
+        return None
+
+    size = getattr(image_ref, 'size', None)
+    if size is None or max(size.width, size.height) > max_dimension:
+        return None
+
+    prefix, _, payload = str(image_ref.uri).partition(',')
+    if prefix != 'data:image/png;base64' or not payload:
+        return None
+    try:
+        return _b64decode(payload, validate=True)
+    except ValueError:
+        return None
+
+
+def _orjson_matches_config() -> bool:
+    """Return True if orjson can produce the configured JSON formatting (UTF-8, 2-space indent)."""
+    return orjson is not None and JSONConfig.INDENT_SIZE == 2 and not JSONConfig.ENSURE_ASCII
+
+
+def _encode_json(value: Any) -> bytes:
+    """Encode a value as UTF-8 JSON with the configured indent, as save_to_json writes it."""
+    if _orjson_matches_config():
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=JSONConfig.INDENT_SIZE,
+                      ensure_ascii=JSONConfig.ENSURE_ASCII).encode('utf-8')
+
 
 class PDFProcessor:
     """
@@ -79,19 +207,45 @@ class PDFProcessor:
         self.config = config or {}
         self.text_processor = TextProcessor()
         self.file_manager = FileManager()
+
+        # Resolve settings read on every item once, along with the bound text
+        # helpers used in the extraction loop
+        self._image_scale = self.config.get('image_scale', PDFProcessingConfig.IMAGE_SCALE)
+        self._max_file_size_mb = self.config.get('max_file_size_mb', 100)
+        self._main_header_min_length = self.config.get(
+            'main_header_min_length',
+            PDFProcessingConfig.MAIN_HEADER_MIN_LENGTH
+        )
+        self._min_text_length = self.config.get('min_text_length', JSONConfig.MIN_TEXT_LENGTH)
+        self._max_image_dimension = self.config.get('max_image_dimension', 2048)
+        self._get_text = self.text_processor.safe_get_text
+        self._clean_text = self.text_processor.clean_text
+
         self.converter = self._configure_pipeline()
 
         # Processing state
         self.current_main_section = None
         self.current_subsection = None
-        self.section_hierarchy = []
+        self.section_hierarchy: Tuple[str, ...] = ()  # Rebuilt only at headers; shared by every item
         self.in_references_section = False
+        self.item_count = 0
+
+        # Per-section counts gathered during extraction (see finalize_section_summary)
+        self._section_stats: Dict[Optional[str], Dict[str, Any]] = {}
+        self._section_order: Dict[Optional[str], Tuple[int, int]] = {}
 
         # Image/table counters for file naming
         self.table_counter = 0
         self.picture_counter = 0
         self.page_counter = 0
 
+        # PNG encoding releases the GIL, so image saves are handed to a small
+        # thread pool (created on first use) while extraction continues
+        self._image_pool: Optional[ThreadPoolExecutor] = None
+        self._image_futures: List[Future] = []
+        # Save started by the last process_picture_item call (None if it finished synchronously)
+        self._picture_save: Optional[Future] = None
+
         logger.info("PDF Processor initialized with Docling backend")
 
     def _configure_pipeline(self) -> DocumentConverter:
@@ -103,10 +257,7 @@ class PDFProcessor:
         """
         # Create pipeline options with configuration
         pipeline_options = PdfPipelineOptions()
-        pipeline_options.images_scale = self.config.get(
-            'image_scale',
-            PDFProcessingConfig.IMAGE_SCALE
-        )
+        pipeline_options.images_scale = self._image_scale
         pipeline_options.generate_page_images = self.config.get(
             'generate_page_images',
             PDFProcessingConfig.GENERATE_PAGE_IMAGES
@@ -156,7 +307,7 @@ class PDFProcessor:
 
         # Check file size limits
         file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        max_size = self.config.get('max_file_size_mb', 100)
+        max_size = self._max_file_size_mb
         if file_size_mb > max_size:
             raise ValueError(f"File too large: {file_size_mb:.1f}MB > {max_size}MB")
 
@@ -175,7 +326,7 @@ class PDFProcessor:
             self.picture_counter = 0
             self.page_counter = 0
 
-            logger.info(f"Successfully processed PDF with {len(list(doc.iterate_items()))} items")
+            logger.info(f"Successfully processed PDF: {file_path.name}")
             return doc
 
         except Exception as e:
@@ -216,7 +367,7 @@ class PDFProcessor:
         Returns:
             String representation of item type
         """
-        return type(item).__name__.lower()
+        return _type_name(type(item))
 
     def is_references_section(self, item: Any) -> bool:
         """
@@ -231,12 +382,12 @@ class PDFProcessor:
         if not PDFProcessingConfig.DETECT_REFERENCES:
             return False
 
-        item_type = self.get_item_type(item)
-        text = self.safe_get_text(item)
+        if not _is_header_class(type(item)):
+            return False
 
-        if text and ('header' in item_type or 'heading' in item_type or 'section' in item_type):
-            pattern = r'\b(' + '|'.join(PDFProcessingConfig.REFERENCE_KEYWORDS) + r')\b'
-            return bool(re.search(pattern, text, re.IGNORECASE))
+        text = self._get_text(item)
+        if text:
+            return bool(_REF_RE.search(text))
 
         return False
 
@@ -250,38 +401,29 @@ class PDFProcessor:
         Returns:
             True if item is a main section header
         """
-        item_type = self.get_item_type(item)
-        text = self.safe_get_text(item)
+        if not _is_header_class(type(item)):
+            return False
 
-        if not text or not ('header' in item_type or 'heading' in item_type or 'section' in item_type):
+        text = self._get_text(item)
+        if not text:
             return False
 
         # Check for main header indicators
-        text_upper = text.upper()
-        min_length = self.config.get('main_header_min_length', PDFProcessingConfig.MAIN_HEADER_MIN_LENGTH)
+        min_length = self._main_header_min_length
 
         # Main headers are typically:
         # 1. All caps or mostly caps
         # 2. Longer descriptive titles
         # 3. Common section keywords
         # 4. End with colons
-        main_keywords = [
-            'abstract', 'introduction', 'methods', 'methodology', 'results',
-            'discussion', 'conclusion', 'references', 'bibliography',
-            'acknowledgments', 'appendix', 'background', 'literature review',
-            'analysis', 'findings', 'implications', 'limitations'
-        ]
-
-        # Check if it's a main header
-        conditions = [
-            len(text) > min_length,  # Long descriptive titles
-            text.isupper(),  # All uppercase
-            any(keyword in text.lower() for keyword in main_keywords),  # Contains main keywords
-            text.endswith(':'),  # Ends with colon
-            text.count(' ') >= 3  # Multi-word titles
-        ]
-
-        return any(conditions)
+        # Cheapest checks first; the keyword scan is one regex pass
+        return (
+            len(text) > min_length  # Long descriptive titles
+            or text.isupper()  # All uppercase
+            or text.endswith(':')  # Ends with colon
+            or text.count(' ') >= 3  # Multi-word titles
+            or _MAIN_KEYWORD_RE.search(text.lower()) is not None  # Contains main keywords
+        )
 
     def update_section_context(self, item: Any) -> None:
         """
@@ -290,11 +432,9 @@ class PDFProcessor:
         Args:
             item: Document item to analyze for section information
         """
-        item_type = self.get_item_type(item)
-
         # Check if this is a header/section item
-        if 'header' in item_type or 'heading' in item_type or 'section' in item_type:
-            text = self.safe_get_text(item)
+        if _is_header_class(type(item)):
+            text = self._get_text(item)
             if not text:
                 return
 
@@ -302,7 +442,7 @@ class PDFProcessor:
                 # This is a main section header
                 self.current_main_section = text
                 self.current_subsection = None
-                self.section_hierarchy = [self.current_main_section]
+                self.section_hierarchy = (self.current_main_section,)
 
                 # Check if this is the references section
                 if self.is_references_section(item):
@@ -317,9 +457,9 @@ class PDFProcessor:
                 # This is a subsection header
                 self.current_subsection = text
                 if self.current_main_section:
-                    self.section_hierarchy = [self.current_main_section, self.current_subsection]
+                    self.section_hierarchy = (self.current_main_section, self.current_subsection)
                 else:
-                    self.section_hierarchy = [self.current_subsection]
+                    self.section_hierarchy = (self.current_subsection,)
 
                 logger.debug(f"New subsection: {text}")
 
@@ -334,7 +474,7 @@ class PDFProcessor:
         Returns:
             Dictionary containing table data and metadata
         """
-        table_content = self.safe_get_text(item)
+        table_content = self._get_text(item)
 
         # Fallback content extraction
         if not table_content:
@@ -349,7 +489,7 @@ class PDFProcessor:
             "content": table_content,
             "caption": self.safe_get_caption(item),
             "item_type": self.get_item_type(item),
-            "section_hierarchy": self.section_hierarchy.copy(),
+            "section_hierarchy": self.section_hierarchy,
             "parent_section": self.current_main_section,
             "subsection": self.current_subsection
         }
@@ -363,38 +503,54 @@ class PDFProcessor:
             doc: Parent document object
 
         Returns:
-            Dictionary containing image data and metadata, or None if processing fails
+            Dictionary containing image data and metadata, or None if processing fails.
+            When the PNG is saved in the background, self._picture_save holds its future.
         """
+        self._picture_save = None
         try:
             self.picture_counter += 1
 
-            # Save image as external file
-            pil_image = item.get_image(doc)
             image_filename = f"{self.doc_filename}-picture-{self.picture_counter}.png"
             image_path = self.output_dir / image_filename
 
             # Ensure output directory exists
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Optimize image if needed
-            if hasattr(pil_image, 'size'):
-                width, height = pil_image.size
-                # Resize if too large (optional optimization)
-                max_dimension = self.config.get('max_image_dimension', 2048)
-                if max(width, height) > max_dimension:
-                    ratio = max_dimension / max(width, height)
-                    new_size = (int(width * ratio), int(height * ratio))
-                    pil_image = pil_image.resize(new_size, resample=1)  # LANCZOS
-
-            # Save image file
-            pil_image.save(image_path, format="PNG", optimize=True)
+            max_dimension = self._max_image_dimension
+            raw_png = _unchanged_png_bytes(item, max_dimension)
+            if raw_png is not None:
+                # Already a PNG within the size cap: write it verbatim rather
+                # than decoding and re-deflating it
+                image_path.write_bytes(raw_png)
+            else:
+                # Save image as external file
+                pil_image = item.get_image(doc)
+
+                # Optimize image if needed
+                if hasattr(pil_image, 'size'):
+                    width, height = pil_image.size
+                    # Resize if too large (optional optimization)
+                    if max(width, height) > max_dimension:
+                        ratio = max_dimension / max(width, height)
+                        new_size = (int(width * ratio), int(height * ratio))
+                        pil_image = pil_image.resize(new_size, resample=Image.Resampling.LANCZOS)
+
+                # PNG cannot store modes such as CMYK or YCbCr; convert those up front
+                if pil_image.mode not in _PNG_MODES:
+                    pil_image = pil_image.convert('RGB')
+
+                # Save image file at the default deflate level; optimize=True would
+                # add a second, much slower compression search for a few percent.
+                # A failed background save drops the item in iter_structured_items,
+                # as a synchronous failure does here.
+                self._picture_save = self._start_image_save(pil_image, image_path)
 
             return {
                 "image_filename": image_filename,
                 "image_path": str(image_path),
                 "caption": self.safe_get_caption(item),
                 "item_type": self.get_item_type(item),
-                "section_hierarchy": self.section_hierarchy.copy(),
+                "section_hierarchy": self.section_hierarchy,
                 "parent_section": self.current_main_section,
                 "subsection": self.current_subsection
             }
@@ -413,20 +569,20 @@ class PDFProcessor:
         Returns:
             Dictionary containing text data and metadata, or None if no valid text
         """
-        text = self.safe_get_text(item)
+        text = self._get_text(item)
 
         # Apply minimum length filter
-        min_length = self.config.get('min_text_length', JSONConfig.MIN_TEXT_LENGTH)
+        min_length = self._min_text_length
         if not text or len(text.strip()) < min_length:
             return None
 
         # Clean and normalize text
-        text = self.text_processor.clean_text(text)
+        text = self._clean_text(text)
 
         return {
             "type": self.get_item_type(item),
             "text": text,
-            "section_hierarchy": self.section_hierarchy.copy(),
+            "section_hierarchy": self.section_hierarchy,
             "parent_section": self.current_main_section,
             "subsection": self.current_subsection
         }
@@ -445,9 +601,9 @@ class PDFProcessor:
                 "processor_version": "1.0.0",
                 "docling_version": None,  # Could be extracted from docling
                 "configuration": {
-                    "image_scale": self.config.get('image_scale', PDFProcessingConfig.IMAGE_SCALE),
+                    "image_scale": self._image_scale,
                     "detect_references": PDFProcessingConfig.DETECT_REFERENCES,
-                    "min_text_length": self.config.get('min_text_length', JSONConfig.MIN_TEXT_LENGTH)
+                    "min_text_length": self._min_text_length
                 }
             },
             "content": [],
@@ -456,7 +612,7 @@ class PDFProcessor:
             "references": []
         }
 
-    def extract_structured_data(self, doc: Any) -> Dict[str, Any]:
+    def extract_structured_data(self, doc: Any, write_images: bool = False) -> Dict[str, Any]:
         """
         Extract and structure content from the document.
 
@@ -465,70 +621,28 @@ class PDFProcessor:
 
         Args:
             doc: Docling document object to process
+            write_images: Also save each table as a PNG during the same pass
 
         Returns:
             Structured data dictionary with content, tables, images, and references
         """
         structured_data = self.initialize_structure()
-        item_count = 0
-
-        # Reset processing state
-        self.current_main_section = None
-        self.current_subsection = None
-        self.section_hierarchy = []
-        self.in_references_section = False
-
-        logger.info("Extracting and structuring document content...")
 
         try:
-            # Process all document items
-            for item, _ in doc.iterate_items():
-                item_count += 1
-
-                # Update section context
-                self.update_section_context(item)
-
-                # Process items based on type and context
-                if self.in_references_section:
-                    # Handle references section
-                    text_data = self.process_text_item(item)
-                    if text_data:
-                        structured_data["references"].append(text_data)
-
-                elif isinstance(item, TableItem):
-                    # Handle tables
-                    table_data = self.process_table_item(item, doc)
-                    table_data["label"] = f"table_{len(structured_data['tables']) + 1}"
-                    structured_data["tables"].append(table_data)
-
-                elif isinstance(item, PictureItem):
-                    # Handle images
-                    image_data = self.process_picture_item(item, doc)
-                    if image_data:
-                        image_data["label"] = f"image_{len(structured_data['images']) + 1}"
-                        structured_data["images"].append(image_data)
-
-                else:
-                    # Handle regular text content
-                    text_data = self.process_text_item(item)
-                    if text_data:
-                        structured_data["content"].append(text_data)
-
-                # Progress logging
-                if item_count % 50 == 0:
-                    logger.debug(f"Processed {item_count} items...")
+            for category, item_data in self.iter_structured_items(doc, write_images):
+                structured_data[category].append(item_data)
 
         except Exception as e:
             logger.error(f"Error during document processing: {e}")
             raise
 
         # Update metadata
-        structured_data["metadata"]["total_items"] = item_count
+        structured_data["metadata"]["total_items"] = self.item_count
         structured_data["metadata"]["processing_timestamp"] = datetime.now().isoformat()
 
         # Log processing summary
         logger.info(f"Document processing complete:")
-        logger.info(f"  Total items: {item_count}")
+        logger.info(f"  Total items: {self.item_count}")
         logger.info(f"  Content items: {len(structured_data['content'])}")
         logger.info(f"  Tables: {len(structured_data['tables'])}")
         logger.info(f"  Images: {len(structured_data['images'])}")
@@ -536,6 +650,250 @@ class PDFProcessor:
 
         return structured_data
 
+    def iter_structured_items(self, doc: Any, write_images: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield structured items one at a time in a single pass over the document.
+
+        Once the generator is exhausted, self.item_count holds the number of
+        document items seen, and the table/picture counters the number of
+        images saved. Pictures whose PNG is still being written in the
+        background are yielded once the save succeeds (and dropped if it
+        fails), so they can arrive slightly after later items of other
+        categories. Stopping early cancels or waits out pending saves.
+
+        Args:
+            doc: Docling document object to process
+            write_images: Also save each table as a PNG (pictures are always
+                saved by process_picture_item)
+
+        Yields:
+            Tuples of (category, item_data), where category is one of
+            "content", "tables", "images" or "references"
+        """
+        self.item_count = 0
+        self.table_counter = 0
+        self.picture_counter = 0
+        image_count = 0
+
+        # Reset processing state
+        self.current_main_section = None
+        self.current_subsection = None
+        self.section_hierarchy = ()
+        self.in_references_section = False
+        self._section_stats = {}
+        self._section_order = {}
+
+        logger.info("Extracting and structuring document content...")
+
+        # Pictures waiting for their PNG save, in document order
+        pending_pictures = deque()
+
+        def ready_pictures(block: bool) -> Iterator[Dict[str, Any]]:
+            """Pop pictures whose save has finished; failed saves drop the picture."""
+            nonlocal image_count
+            while pending_pictures:
+                future, image_data = pending_pictures[0]
+                if future is not None:
+                    if not block and not future.done():
+                        return
+                    error = future.exception()
+                    if error is not None:
+                        pending_pictures.popleft()
+                        logger.warning(f"Error processing image: {error}")
+                        continue
+                pending_pictures.popleft()
+                image_count += 1
+                image_data["label"] = f"image_{image_count}"
+                yield image_data
+
+        finished = False
+        try:
+            for category, item_data in self._iter_item_data(doc, write_images, pending_pictures):
+                if item_data:
+                    self._record_section_stats(category, item_data)
+                    yield category, item_data
+                for image_data in ready_pictures(block=False):
+                    self._record_section_stats("images", image_data)
+                    yield "images", image_data
+
+            for image_data in ready_pictures(block=True):
+                self._record_section_stats("images", image_data)
+                yield "images", image_data
+
+            # Table images of this document are complete once extraction finishes
+            self._wait_for_image_saves()
+            finished = True
+        finally:
+            if not finished:
+                self._discard_image_saves([future for future, _ in pending_pictures if future is not None])
+
+    def _iter_item_data(self, doc: Any, write_images: bool,
+                        pending_pictures: deque) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Walk the document for iter_structured_items, yielding (category, item_data or None).
+
+        Pictures are not yielded; they are appended to pending_pictures as
+        (save future or None, image_data) for the caller to release in order.
+
+        Args:
+            doc: Docling document object to process
+            write_images: Also save each table as a PNG
+            pending_pictures: Queue receiving processed pictures
+        """
+        table_count = 0
+
+        for item, _ in doc.iterate_items():
+            self.item_count += 1
+
+            # Update section context
+            self.update_section_context(item)
+
+            # Process items based on type and context
+            if self.in_references_section:
+                # Handle references section
+                category = "references"
+                item_data = self.process_text_item(item)
+
+            elif isinstance(item, TableItem):
+                # Handle tables
+                category = "tables"
+                item_data = self.process_table_item(item, doc)
+                if write_images:
+                    self._save_table_image(item, doc)
+                table_count += 1
+                item_data["label"] = f"table_{table_count}"
+
+            elif isinstance(item, PictureItem):
+                # Handle images; labelled by the caller once the save succeeds
+                category = "images"
+                image_data = self.process_picture_item(item, doc)
+                if image_data:
+                    pending_pictures.append((self._picture_save, image_data))
+                item_data = None
+
+            else:
+                # Handle regular text content
+                category = "content"
+                item_data = self.process_text_item(item)
+
+            yield category, item_data
+
+            # Progress logging every 64 items (bitmask instead of modulo)
+            if not self.item_count & 0x3F:
+                logger.debug(f"Processed {self.item_count} items...")
+
+    def _record_section_stats(self, category: str, item_data: Dict[str, Any]) -> None:
+        """
+        Count an extracted item towards its section's summary.
+
+        Args:
+            category: Category the item was emitted under
+            item_data: The extracted item
+        """
+        parent = item_data.get("parent_section", "Unknown")
+        stats = self._section_stats.get(parent)
+        if stats is None:
+            stats = self._section_stats[parent] = {
+                "content_count": 0,
+                "table_count": 0,
+                "image_count": 0,
+                "reference_count": 0,
+                "subsections": set()
+            }
+
+        # Remember where the section first appears in category order, so the
+        # summary lists sections exactly as get_section_summary would
+        category_index = _CATEGORIES.index(category)
+        first_seen = self._section_order.get(parent)
+        if first_seen is None or category_index < first_seen[0]:
+            self._section_order[parent] = (category_index, self.item_count)
+
+        stats[_COUNT_KEYS[category]] += 1
+        subsection = item_data.get("subsection")
+        if subsection:
+            stats["subsections"].add(subsection)
+
+    def finalize_section_summary(self) -> Dict[str, Dict]:
+        """
+        Return the section summary gathered during the last extraction.
+
+        Equivalent to get_section_summary() on the extracted data, without a
+        second pass over it.
+
+        Returns:
+            Dictionary mapping section names to content statistics
+        """
+        sections = {}
+        for parent in sorted(self._section_stats, key=self._section_order.__getitem__):
+            stats = dict(self._section_stats[parent])
+            stats["subsections"] = sorted(stats["subsections"])
+            sections[parent] = stats
+        return sections
+
+    def stream_to_json(self, doc: Any, filename: str, write_images: bool = False) -> Dict[str, Any]:
+        """
+        Extract the document straight to a structured JSON file with bounded memory.
+
+        Items are formatted as they are produced and appended to one shard file
+        per category, then the shards are copied into the final JSON object, so
+        the whole document is never held in memory. The file is byte-for-byte
+        what save_to_json writes for the same data.
+
+        Args:
+            doc: Docling document object to process
+            filename: Output JSON filename
+            write_images: Also save each table as a PNG during the same pass
+
+        Returns:
+            The metadata dictionary written to the file
+        """
+        output_path = Path(filename)
+        shard_dir = output_path.parent / f".{output_path.stem}_shards"
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        indent = b' ' * JSONConfig.INDENT_SIZE
+        item_break = b'\n' + indent * 2
+        counts = dict.fromkeys(_CATEGORIES, 0)
+
+        try:
+            # Pass 1: each item indented as it sits inside its category list
+            with ExitStack() as stack:
+                shards = {
+                    category: stack.enter_context(
+                        open(shard_dir / f"{category}.part", 'wb', buffering=1 << 20))
+                    for category in _CATEGORIES
+                }
+                for category, item_data in self.iter_structured_items(doc, write_images):
+                    shard = shards[category]
+                    shard.write(b',' + item_break if counts[category] else item_break)
+                    shard.write(_encode_json(item_data).replace(b'\n', item_break))
+                    counts[category] += 1
+
+            metadata = self.initialize_structure()["metadata"]
+            metadata["total_items"] = self.item_count
+            metadata["processing_timestamp"] = datetime.now().isoformat()
+
+            # Pass 2: assemble {"metadata": ..., "content": [...], ...}
+            with open(output_path, 'wb', buffering=1 << 20) as out:
+                out.write(b'{\n' + indent + b'"metadata": ')
+                out.write(_encode_json(metadata).replace(b'\n', b'\n' + indent))
+                for category in _CATEGORIES:
+                    out.write(b',\n' + indent + json.dumps(category).encode('utf-8') + b': [')
+                    if counts[category]:
+                        with open(shard_dir / f"{category}.part", 'rb') as shard:
+                            shutil.copyfileobj(shard, out, 1 << 20)
+                        out.write(b'\n' + indent)
+                    out.write(b']')
+                out.write(b'\n}')
+
+        except Exception as e:
+            logger.error(f"Error streaming structured data to {output_path}: {e}")
+            raise
+        finally:
+            shutil.rmtree(shard_dir, ignore_errors=True)
+
+        logger.info(f"Successfully streamed structured data to {output_path} ({self.item_count} items)")
+        return metadata
+
     def get_section_summary(self, data: Dict) -> Dict[str, Dict]:
         """
         Generate a summary of all sections and their content counts.
@@ -548,7 +906,7 @@ class PDFProcessor:
         """
         sections = {}
 
-        for category in ["content", "tables", "images", "references"]:
+        for category in _CATEGORIES:
             for item in data.get(category, []):
                 parent = item.get("parent_section", "Unknown")
                 subsection = item.get("subsection")
@@ -562,15 +920,7 @@ class PDFProcessor:
                         "subsections": set()
                     }
 
-                # Map category names to count keys
-                count_key_map = {
-                    "content": "content_count",
-                    "tables": "table_count",
-                    "images": "image_count",
-                    "references": "reference_count"
-                }
-
-                sections[parent][count_key_map[category]] += 1
+                sections[parent][_COUNT_KEYS[category]] += 1
 
                 if subsection:
                     sections[parent]["subsections"].add(subsection)
@@ -601,18 +951,21 @@ class PDFProcessor:
 
         section_name_lower = section_name.lower()
 
-        for category in ["content", "tables", "images", "references"]:
+        for category in _CATEGORIES:
+            append = filtered_data[category].append
             for item in data.get(category, []):
                 # Check if the section name matches any level in the hierarchy
-                if item.get("section_hierarchy"):
-                    for section in item["section_hierarchy"]:
-                        if section_name_lower in section.lower():
-                            filtered_data[category].append(item)
+                hierarchy = item.get("section_hierarchy")
+                if hierarchy:
+                    for section in hierarchy:
+                        if section_name_lower in _section_lower(section):
+                            append(item)
                             break
                 # Also check parent_section for direct matches
-                elif (item.get("parent_section") and
-                      section_name_lower in item["parent_section"].lower()):
-                    filtered_data[category].append(item)
+                else:
+                    parent = item.get("parent_section")
+                    if parent and section_name_lower in _section_lower(parent):
+                        append(item)
 
         return filtered_data
 
@@ -631,13 +984,17 @@ class PDFProcessor:
             output_path = Path(filename)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(
-                    data,
-                    f,
-                    indent=JSONConfig.INDENT_SIZE,
-                    ensure_ascii=JSONConfig.ENSURE_ASCII
-                )
+            # orjson only writes UTF-8 with a 2-space indent; other settings use json
+            if _orjson_matches_config():
+                output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(
+                        data,
+                        f,
+                        indent=JSONConfig.INDENT_SIZE,
+                        ensure_ascii=JSONConfig.ENSURE_ASCII
+                    )
 
             logger.info(f"Successfully saved structured data to {output_path}")
 
@@ -676,8 +1033,8 @@ class PDFProcessor:
             # Save structured data
             self.save_to_json(structured_data, str(output_filename))
 
-            # Generate and save section summary
-            section_summary = self.get_section_summary(structured_data)
+            # Save the section summary gathered during extraction
+            section_summary = self.finalize_section_summary()
             summary_filename = output_path / f"{file_stem}_section_summary.json"
             self.save_to_json(section_summary, str(summary_filename))
 
@@ -691,13 +1048,17 @@ class PDFProcessor:
             raise
 
 
-    def process_pdf_with_images(self, file_path: str, output_dir: Optional[str] = None) -> Tuple[Any, str]:
+    def process_pdf_with_images(self, file_path: str, output_dir: Optional[str] = None,
+                                save_images: bool = True) -> Tuple[Any, str]:
         """
         Enhanced PDF processing with image extraction following Docling best practices.
 
         Args:
             file_path: Path to input PDF file
             output_dir: Optional output directory (defaults to "output")
+            save_images: Save table and picture PNGs here; pass False when the
+                caller extracts with write_images=True so the document is only
+                walked once
 
         Returns:
             Tuple of (document, output_directory_path)
@@ -726,7 +1087,8 @@ class PDFProcessor:
             doc = conv_res.document
 
             # Save individual images from tables and pictures
-            self._save_document_images(conv_res)
+            if save_images:
+                self._save_document_images(conv_res)
 
             # Generate markdown files
             self._save_markdown_outputs(conv_res, output_path)
@@ -746,27 +1108,112 @@ class PDFProcessor:
         # Save images of figures and tables
         for element, _level in conv_res.document.iterate_items():
             if isinstance(element, TableItem):
-                self.table_counter += 1
-                element_image_filename = (
-                    self.output_dir / f"{self.doc_filename}-table-{self.table_counter}.png"
-                )
-                with element_image_filename.open("wb") as fp:
-                    element.get_image(conv_res.document).save(fp, "PNG")
-                logger.debug(f"Saved table image: {element_image_filename}")
+                self._save_table_image(element, conv_res.document)
 
             if isinstance(element, PictureItem):
                 self.picture_counter += 1
                 element_image_filename = (
                     self.output_dir / f"{self.doc_filename}-picture-{self.picture_counter}.png"
                 )
-                with element_image_filename.open("wb") as fp:
-                    element.get_image(conv_res.document).save(fp, "PNG")
-                logger.debug(f"Saved picture image: {element_image_filename}")
+                self._submit_image_save(element.get_image(conv_res.document), element_image_filename)
+                logger.debug(f"Queued picture image: {element_image_filename}")
+
+        self._wait_for_image_saves()
+
+    def _save_table_image(self, item: TableItem, doc: Any) -> None:
+        """Save a table's rendered image as the next numbered table PNG."""
+        self.table_counter += 1
+        element_image_filename = (
+            self.output_dir / f"{self.doc_filename}-table-{self.table_counter}.png"
+        )
+        self._submit_image_save(item.get_image(doc), element_image_filename)
+        logger.debug(f"Queued table image: {element_image_filename}")
+
+    def _start_image_save(self, pil_image: Any, image_path: Path) -> Optional[Future]:
+        """
+        Save a PIL image as PNG, on the image thread pool when parallel processing is enabled.
+
+        The image must not be modified after it is submitted.
+
+        Args:
+            pil_image: Image to save
+            image_path: Destination PNG path
+
+        Returns:
+            The pending save, or None if it was done synchronously (errors raise)
+        """
+        if not PerformanceConfig.PARALLEL_PROCESSING:
+            pil_image.save(image_path, format="PNG")
+            return None
+        if self._image_pool is None:
+            self._image_pool = ThreadPoolExecutor(
+                max_workers=min(8, PerformanceConfig.MAX_WORKERS),
+                thread_name_prefix="png-writer"
+            )
+        return self._image_pool.submit(pil_image.save, image_path, format="PNG")
+
+    def _submit_image_save(self, pil_image: Any, image_path: Path) -> None:
+        """
+        Save a PIL image as PNG, raising any failure from _wait_for_image_saves.
+
+        Args:
+            pil_image: Image to save
+            image_path: Destination PNG path
+        """
+        future = self._start_image_save(pil_image, image_path)
+        if future is not None:
+            self._image_futures.append(future)
+
+    def _discard_image_saves(self, extra_futures: List[Future]) -> None:
+        """
+        Cancel queued image saves and wait for the running ones, ignoring failures.
+
+        Used when extraction stops early, so no save outlives the pass.
+
+        Args:
+            extra_futures: Saves tracked outside self._image_futures
+        """
+        futures, self._image_futures = self._image_futures + extra_futures, []
+        for future in futures:
+            future.cancel()
+        wait(futures)
+
+    def _wait_for_image_saves(self) -> None:
+        """
+        Block until all queued image saves finish.
+
+        Raises:
+            Exception: The first failed save, after every failure has been
+                logged, since the extracted data references the missing files
+        """
+        futures, self._image_futures = self._image_futures, []
+        errors = [error for error in (future.exception() for future in futures) if error is not None]
+        for error in errors:
+            logger.error(f"Error saving image: {error}")
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """Finish pending image saves and shut down the image thread pool."""
+        try:
+            self._wait_for_image_saves()
+        finally:
+            if self._image_pool is not None:
+                self._image_pool.shutdown()
+                self._image_pool = None
+
+    def __enter__(self) -> "PDFProcessor":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
 
     def _save_markdown_outputs(self, conv_res: Any, output_path: Path) -> None:
         """Save markdown files with different image reference modes."""
         # Save markdown with embedded pictures (base64)
         md_embedded_filename = output_path / f"{self.doc_filename}-with-images.md"
+        # Docling base64-encodes each image here with its own encoder; the stdlib
+        # is deliberately not patched to route this through pybase64
         conv_res.document.save_as_markdown(md_embedded_filename, image_mode=ImageRefMode.EMBEDDED)
         logger.info(f"Saved markdown with embedded images: {md_embedded_filename}")
 
@@ -798,15 +1245,13 @@ class PDFProcessor:
             Dictionary with paths to all generated files
         """
         try:
-            # Enhanced PDF processing with images
-            doc, output_path = self.process_pdf_with_images(file_path, output_dir)
-
-            # Extract structured data for custom JSON/HTML
-            structured_data = self.extract_structured_data(doc)
+            # Enhanced PDF processing; images are saved during extraction below
+            doc, output_path = self.process_pdf_with_images(file_path, output_dir, save_images=False)
 
-            # Save custom structured JSON
+            # Stream the structured JSON for custom HTML straight to disk,
+            # saving table and picture images in the same pass over the document
             json_filename = Path(output_path) / f"{Path(file_path).stem}_structured.json"
-            self.save_to_json(structured_data, str(json_filename))
+            self.stream_to_json(doc, str(json_filename), write_images=True)
 
             return {
                 'output_directory': output_path,
@@ -826,14 +1271,14 @@ class PDFProcessor:
 # Convenience functions for backward compatibility
 def process_pdf(file_path: str) -> Any:
     """Convenience function to process PDF with default settings."""
-    processor = PDFProcessor()
-    return processor.process_pdf(file_path)
+    with PDFProcessor() as processor:
+        return processor.process_pdf(file_path)
 
 
 def extract_structured_data(doc: Any) -> Dict[str, Any]:
     """Convenience function to extract structured data with default settings."""
-    processor = PDFProcessor()
-    return processor.extract_structured_data(doc)
+    with PDFProcessor() as processor:
+        return processor.extract_structured_data(doc)
 
 
 def main():
@@ -847,8 +1292,8 @@ def main():
     pdf_file = sys.argv[1]
 
     try:
-        processor = PDFProcessor()
-        structured_data, output_file = processor.process_document(pdf_file)
+        with PDFProcessor() as processor:
+            structured_data, output_file = processor.process_document(pdf_file)
 
         print(f"\nProcessing completed successfully!")
         print(f"Structured data saved to: {output_file}")
@@ -21,11 +21,17 @@ import json
 import shutil
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Union, Tuple
 import mimetypes
 from datetime import datetime
 import hashlib
 
+try:
+    # orjson is pulled in by the langchain stack; fall back to the stdlib parser
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,7 +77,7 @@ class FileManager:
 
         try:
             dir_path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {dir_path}")
+            logger.debug("Ensured directory exists: %s", dir_path)
             return dir_path
         except PermissionError as e:
             logger.error(f"Permission denied creating directory {dir_path}: {e}")
@@ -268,6 +274,40 @@ class FileManager:
             logger.error(f"Error writing file {path}: {e}")
             raise
 
+    def write_text_stream(self, file_path: Union[str, Path], chunks: Iterable[Union[str, bytes]],
+                          encoding: str = 'utf-8', buffer_size: int = 1 << 20) -> None:
+        """
+        Write text chunks to file as they are produced, without joining them first.
+
+        Args:
+            file_path: Path for the output file
+            chunks: Iterable of text fragments, written in order. bytes chunks
+                are taken as already encoded and written unchanged
+            encoding: Text encoding to use
+            buffer_size: Size of the write buffer in bytes
+
+        Raises:
+            PermissionError: If file cannot be written
+        """
+        path = self.validate_file_path(file_path, must_exist=False)
+
+        # Ensure parent directory exists
+        self.ensure_directory(path.parent)
+
+        try:
+            # Encode each chunk once and hand the bytes to a buffered binary
+            # writer, skipping the text layer's newline translation
+            with open(path, 'wb', buffering=buffer_size) as f:
+                write = f.write
+                for chunk in chunks:
+                    write(chunk if isinstance(chunk, bytes) else chunk.encode(encoding))
+
+            logger.debug("Wrote text file: %s", path)
+
+        except Exception as e:
+            logger.error("Error writing file %s: %s", path, e)
+            raise
+
     def read_json_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Read and parse JSON file.
@@ -284,17 +324,19 @@ class FileManager:
         path = self.validate_file_path(file_path)
 
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Parse the raw bytes directly; both parsers decode UTF-8 themselves.
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+            raw = path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-            logger.debug(f"Read JSON file: {path}")
+            logger.debug("Read JSON file: %s", path)
             return data
 
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {path}: {e}")
+            logger.error("Invalid JSON in %s: %s", path, e)
             raise
         except Exception as e:
-            logger.error(f"Error reading JSON file {path}: {e}")
+            logger.error("Error reading JSON file %s: %s", path, e)
             raise
 
     def write_json_file(self, file_path: Union[str, Path], data: Dict[str, Any],
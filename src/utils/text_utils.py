@@ -39,6 +39,12 @@ class TextProcessor:
         self.whitespace_pattern = re.compile(r'\s+')
         self.special_chars_pattern = re.compile(r'[^\w\s\-.,;:!?()[\]{}"\']')
         self.multiple_punctuation_pattern = re.compile(r'([.!?]){2,}')
+        self.excess_newlines_pattern = re.compile(r'\n{3,}')
+        self.inline_whitespace_pattern = re.compile(r'[\t\r\f\v]')
+        self.multiple_spaces_pattern = re.compile(r' {2,}')
+        self.upper_title_pattern = re.compile(r'^[A-Z][A-Z\s]+$')
+        self.sentence_boundary_pattern = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+        self.word_pattern = re.compile(r'\b\w+\b')
 
         # Common section keywords for header detection
         self.section_keywords = {
@@ -173,7 +179,7 @@ class TextProcessor:
             cleaned = self.multiple_punctuation_pattern.sub(r'\1', cleaned)
 
         # Remove excessive line breaks
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        cleaned = self.excess_newlines_pattern.sub('\n\n', cleaned)
 
         # Final trim
         return cleaned.strip()
@@ -242,7 +248,7 @@ class TextProcessor:
             text.isupper(),  # All uppercase
             text.endswith(':'),  # Ends with colon
             len(text) > 20 and len(text.split()) >= 3,  # Multi-word descriptive
-            re.match(r'^[A-Z][A-Z\s]+$', text),  # Title case pattern
+            self.upper_title_pattern.match(text),  # Title case pattern
         ]
 
         return any(formatting_indicators)
@@ -284,8 +290,7 @@ class TextProcessor:
             return []
 
         # Simple sentence splitting pattern
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(sentence_pattern, text)
+        sentences = self.sentence_boundary_pattern.split(text)
 
         # Clean and filter sentences
         cleaned_sentences = []
@@ -311,7 +316,7 @@ class TextProcessor:
             return []
 
         # Convert to lowercase and split into words
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = self.word_pattern.findall(text.lower())
 
         # Filter common stop words (simple list)
         stop_words = {
@@ -378,13 +383,13 @@ class TextProcessor:
             return ""
 
         # Replace various whitespace characters with standard space
-        normalized = re.sub(r'[\t\r\f\v]', ' ', text)
+        normalized = self.inline_whitespace_pattern.sub(' ', text)
 
         # Collapse multiple spaces
-        normalized = re.sub(r' {2,}', ' ', normalized)
+        normalized = self.multiple_spaces_pattern.sub(' ', normalized)
 
         # Normalize line breaks
-        normalized = re.sub(r'\n{3,}', '\n\n', normalized)
+        normalized = self.excess_newlines_pattern.sub('\n\n', normalized)
 
         return normalized.strip()
 
@@ -442,7 +447,7 @@ class TextProcessor:
 
         # Basic counts
         char_count = len(text)
-        word_count = len(re.findall(r'\b\w+\b', text))
+        word_count = len(self.word_pattern.findall(text))
         sentence_count = len(self.extract_sentences(text))
         paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
         line_count = len(text.split('\n'))